@@ -0,0 +1,381 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Cost-Based Admission Control
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module keeps cheap requests fast when expensive ones arrive:
+- Every request gets an estimated cost in work units,
+  years × paths × solver iterations (closed forms count as 1)
+- Requests up to fast_lane_cost run at once and never wait
+- Costlier requests share a few slow-lane slots; a bounded number may
+  wait for a slot, the rest are turned away as busy
+- Requests above max_cost are rejected outright with the estimate and
+  the limit (they belong in the background job queue)
+
+Cost estimators take the same JSON payloads as the web endpoints in
+app.py. They only read sizes; malformed payloads are priced as cheap and
+left for the endpoint's own validation to reject.
+"""
+
+import math
+import threading
+
+from compounding import PERIODS_PER_YEAR
+from retirement_algorithms import finallyRetired
+
+
+DEFAULT_FAST_LANE_COST = 10_000
+DEFAULT_MAX_COST = 50_000_000
+DEFAULT_MAX_JOB_COST = 5_000_000_000
+DEFAULT_SLOW_LANE_SLOTS = 2
+DEFAULT_MAX_QUEUED = 8
+DEFAULT_QUEUE_TIMEOUT = 30.0
+
+# maximumExpensed solver iterations: the analytic path is one evaluation,
+# Brent needs at most ~25, bisection log2(balance / epsilon) capped at 100
+_BRENT_ITERATIONS = 25
+_MAX_BISECTION_ITERATIONS = 100
+
+# Errors an estimator may hit on a malformed payload
+_MALFORMED = (KeyError, TypeError, ValueError, OverflowError, AttributeError)
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when the slow lane is full; the client should retry later."""
+
+
+class CostLimitExceeded(AdmissionRejected):
+    """Raised for a request whose estimated cost is above the limit."""
+
+    def __init__(self, cost, limit, hint=""):
+        self.cost = cost
+        self.limit = limit
+        super().__init__(
+            f"Estimated cost {cost:,} work units exceeds the limit of {limit:,}"
+            + (f"; {hint}" if hint else "")
+        )
+
+
+class AdmissionController:
+    """
+    Two-lane admission by estimated cost.
+
+    Time Complexity: O(1) per admission decision
+    Space Complexity: O(1)
+
+    Example:
+        >>> controller = AdmissionController()
+        >>> lane = controller.acquire(estimate_cost("maximumExpensed", payload))
+        >>> try:
+        ...     ...                     # compute
+        ... finally:
+        ...     controller.release(lane)
+    """
+
+    def __init__(self, fast_lane_cost=DEFAULT_FAST_LANE_COST, max_cost=DEFAULT_MAX_COST,
+                 slow_lane_slots=DEFAULT_SLOW_LANE_SLOTS, max_queued=DEFAULT_MAX_QUEUED,
+                 queue_timeout=DEFAULT_QUEUE_TIMEOUT):
+        """
+        Parameters:
+            fast_lane_cost (int): Largest cost admitted without waiting
+            max_cost (int): Largest cost admitted at all
+            slow_lane_slots (int): Costlier requests running at once
+            max_queued (int): Costlier requests allowed to wait for a slot
+            queue_timeout (float): Seconds a request waits before giving up
+
+        Raises:
+            ValueError: If the limits are inconsistent or not positive
+        """
+        if fast_lane_cost <= 0 or max_cost < fast_lane_cost:
+            raise ValueError(
+                f"Need 0 < fast_lane_cost <= max_cost: {fast_lane_cost}, {max_cost}"
+            )
+        if slow_lane_slots <= 0:
+            raise ValueError(f"slow_lane_slots must be positive: {slow_lane_slots}")
+        if max_queued < 0:
+            raise ValueError(f"max_queued cannot be negative: {max_queued}")
+
+        self.fast_lane_cost = fast_lane_cost
+        self.max_cost = max_cost
+        self.slow_lane_slots = slow_lane_slots
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(slow_lane_slots)
+        self._lock = threading.Lock()
+        self._stats = {
+            "fast": 0, "slow": 0, "rejected_cost": 0, "rejected_busy": 0,
+            "waiting": 0, "running_slow": 0,
+        }
+
+    def acquire(self, cost, hint=""):
+        """
+        Admit a request of the given cost, waiting for a slot if needed.
+
+        Returns:
+            str: "fast" or "slow"; pass it to release() when done
+
+        Raises:
+            CostLimitExceeded: If cost > max_cost
+            AdmissionRejected: If the slow lane and its queue are full, or
+                               no slot frees up within queue_timeout
+        """
+        if cost > self.max_cost:
+            with self._lock:
+                self._stats["rejected_cost"] += 1
+            raise CostLimitExceeded(cost, self.max_cost, hint)
+
+        if cost <= self.fast_lane_cost:
+            with self._lock:
+                self._stats["fast"] += 1
+            return "fast"
+
+        # Take a free slot straight away if there is one
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                if self._stats["waiting"] >= self.max_queued:
+                    self._stats["rejected_busy"] += 1
+                    raise AdmissionRejected(
+                        f"Server busy: {self.slow_lane_slots} expensive requests running "
+                        f"and {self._stats['waiting']} waiting; retry later"
+                    )
+                self._stats["waiting"] += 1
+
+            acquired = self._slots.acquire(timeout=self.queue_timeout)
+            with self._lock:
+                self._stats["waiting"] -= 1
+                if not acquired:
+                    self._stats["rejected_busy"] += 1
+            if not acquired:
+                raise AdmissionRejected(
+                    f"Server busy: no slot for an expensive request within "
+                    f"{self.queue_timeout:g}s; retry later"
+                )
+
+        with self._lock:
+            self._stats["slow"] += 1
+            self._stats["running_slow"] += 1
+        return "slow"
+
+    def release(self, lane):
+        """Return the slot taken by acquire() (no-op for the fast lane)."""
+        if lane == "slow":
+            with self._lock:
+                self._stats["running_slow"] -= 1
+            self._slots.release()
+
+    def check(self, cost, limit, hint=""):
+        """Raise CostLimitExceeded if cost > limit (for work that is queued elsewhere)."""
+        if cost > limit:
+            with self._lock:
+                self._stats["rejected_cost"] += 1
+            raise CostLimitExceeded(cost, limit, hint)
+
+    def info(self):
+        """Counters: admissions per lane, rejections, and current queue state."""
+        with self._lock:
+            return dict(self._stats)
+
+
+# ============================================
+# COST ESTIMATORS
+# ============================================
+# Each takes a request payload and returns a whole number of work units.
+
+def estimate_cost(kind, payload):
+    """
+    Estimated cost of a request of the given kind (see COST_ESTIMATORS).
+
+    Raises:
+        ValueError: If the kind is unknown
+    """
+    if kind not in COST_ESTIMATORS:
+        raise ValueError(f"kind must be one of {', '.join(COST_ESTIMATORS)}: {kind}")
+    if not isinstance(payload, dict):
+        return 1
+    try:
+        return max(1, int(COST_ESTIMATORS[kind](payload)))
+    except _MALFORMED:
+        # Malformed input: the endpoint's validation rejects it cheaply
+        return 1
+
+
+def _fixed_investor_cost(payload):
+    """Closed form: O(1)."""
+    return 1
+
+
+def _variable_investor_cost(payload):
+    """One multiplication per year."""
+    return len(payload["rates"])
+
+
+def _finally_retired_cost(payload):
+    """Closed form: O(1)."""
+    return 1
+
+
+def _maximum_expensed_cost(payload):
+    """Solver iterations, each an O(1) finallyRetired evaluation."""
+    method = payload.get("method", "auto")
+    target_years = payload.get("target_years", 20)
+    if method in ("auto", "analytic") and float(target_years).is_integer():
+        return 1
+    if method == "brent":
+        return _BRENT_ITERATIONS
+    return _bisection_iterations(payload["balance"], payload.get("epsilon", 0.01))
+
+
+def _batch_cost(payload):
+    """Sum of the per-scenario costs (malformed scenarios count as 1)."""
+    estimator = _SCENARIO_ESTIMATORS[payload["algorithm"]]
+    total = 0
+    for scenario in payload["scenarios"]:
+        try:
+            total += estimator(scenario)
+        except _MALFORMED:
+            total += 1
+    return total
+
+
+def _trajectory_cost(payload):
+    """One row per period, up to max_years when it is given."""
+    periods_per_year = PERIODS_PER_YEAR[payload.get("frequency", "annual")]
+    algorithm = payload["algorithm"]
+    max_years = payload.get("max_years")
+    if algorithm == "fixedInvestor":
+        periods = payload["years"] * periods_per_year
+    elif algorithm == "variableInvestor":
+        periods = len(payload["rates"]) * periods_per_year
+    else:
+        periods = _retirement_periods(payload, periods_per_year)
+    if max_years is not None:
+        periods = min(periods, max_years * periods_per_year)
+    # Perpetuities without max_years are rejected by the endpoint
+    return 1 if math.isinf(periods) else periods
+
+
+def _retirement_periods(payload, periods_per_year):
+    """
+    Rows in a finallyRetired trajectory: the O(1) closed-form depletion
+    period, with the per-period inputs the trajectory endpoint uses.
+    """
+    inflation = payload.get("inflation", 0.0)
+    if inflation > -1.0:
+        inflation = (1.0 + inflation) ** (1.0 / periods_per_year) - 1.0
+    return finallyRetired(
+        payload["balance"], payload["expense"] / periods_per_year,
+        payload["rate"] / periods_per_year, inflation=inflation,
+    )
+
+
+def _monte_carlo_cost(payload):
+    """paths × years."""
+    return payload["n_paths"] * payload["n_years"]
+
+
+def _maximum_expensed_job_cost(payload):
+    """Scenarios × worst-case bisection iterations."""
+    size = 1
+    for name in ("balances", "rates", "target_years"):
+        values = payload.get(name, 1)
+        size = max(size, len(values) if isinstance(values, list) else 1)
+    return size * _bisection_iterations(1e9, 0.01)
+
+
+def _withdrawal_frontier_job_cost(payload):
+    """(balance, rate) pairs × durations."""
+    size = 1
+    for name in ("balances", "rates"):
+        values = payload[name]
+        size = max(size, len(values) if isinstance(values, list) else 1)
+    return size * payload["max_years"]
+
+
+def _bisection_iterations(balance, epsilon):
+    """Halvings needed to narrow [0, balance] below epsilon, capped like maximumExpensed."""
+    if balance <= epsilon:
+        return 1
+    return min(_MAX_BISECTION_ITERATIONS, math.ceil(math.log2(balance / epsilon)))
+
+
+_SCENARIO_ESTIMATORS = {
+    "fixedInvestor": _fixed_investor_cost,
+    "variableInvestor": _variable_investor_cost,
+    "finallyRetired": _finally_retired_cost,
+    "maximumExpensed": _maximum_expensed_cost,
+}
+
+COST_ESTIMATORS = {
+    **_SCENARIO_ESTIMATORS,
+    "batch": _batch_cost,
+    "trajectory": _trajectory_cost,
+    "monte_carlo": _monte_carlo_cost,
+    "job:monte_carlo": _monte_carlo_cost,
+    "job:maximum_expensed_batch": _maximum_expensed_job_cost,
+    "job:withdrawal_frontier": _withdrawal_frontier_job_cost,
+}
+
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("ADMISSION LANE CHECKS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    def outcome(function, *args):
+        """Result of function(*args), or the type of the exception it raised."""
+        try:
+            return function(*args)
+        except AdmissionRejected as error:
+            return type(error)
+
+    controller = AdmissionController(fast_lane_cost=10, max_cost=1000, slow_lane_slots=2,
+                                     max_queued=1, queue_timeout=0.2)
+
+    check("Over max_cost is rejected with the estimate",
+          outcome(controller.acquire, 1001) is CostLimitExceeded)
+
+    lanes = [controller.acquire(500), controller.acquire(500)]
+    check("Two slow requests take both slots", lanes == ["slow", "slow"])
+    check("Fast requests still run with the slow lane full",
+          outcome(controller.acquire, 10) == "fast")
+
+    # One request may queue; while it waits, the next one is turned away
+    queued = []
+    waiter = threading.Thread(target=lambda: queued.append(outcome(controller.acquire, 500)))
+    waiter.start()
+    while controller.info()["waiting"] == 0:
+        waiter.join(0.001)
+    check("A request past the queue limit is rejected as busy",
+          outcome(controller.acquire, 500) is AdmissionRejected)
+    waiter.join()
+    check("The queued request gives up after queue_timeout", queued == [AdmissionRejected])
+
+    # A queued request takes the slot a finishing request releases
+    waiter = threading.Thread(target=lambda: queued.append(outcome(controller.acquire, 500)))
+    waiter.start()
+    while controller.info()["waiting"] == 0:
+        waiter.join(0.001)
+    controller.release(lanes.pop())
+    waiter.join()
+    check("A released slot goes to the waiting request", queued[-1] == "slow")
+
+    controller.release("slow")
+    controller.release(lanes.pop())
+    stats = controller.info()
+    check(f"Counters {stats}",
+          stats == {"fast": 1, "slow": 3, "rejected_cost": 1, "rejected_busy": 2,
+                    "waiting": 0, "running_slow": 0})
+
+    print("=" * 70)
@@ -0,0 +1,352 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Precomputed Annuity Factor Table
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module answers latency-critical fixedInvestor and maximumExpensed
+queries from a precomputed table instead of computing them:
+- Accumulation factors  A(r, n) = g + g^2 + ... + g^n    (fixedInvestor)
+- Annuity-due factors   ä(r, n) = 1 + v + ... + v^(n-1)  (maximumExpensed)
+  over a dense rate × years grid, saved as one .npy file and memory-mapped
+- Queries interpolate linearly in the rate on log(factor), which is
+  close to linear (log g^n = n × log(1 + r)), at a whole number of years;
+  each cell carries an error bound and queries fall back to the exact
+  closed forms outside the grid or when the bound exceeds the tolerance
+- maximum_expense steps the interpolated answer down onto the side of
+  the depletion boundary that lasts the target, like maximumExpensed, and
+  hands non-integer targets to maximumExpensed itself
+
+Error Bound:
+    Linear interpolation of a smooth f over a cell of width h errs by at
+    most h²/8 × max|f''|. The midpoint defect |f(mid) - (f(lo) + f(hi)) / 2|
+    equals h²/8 × f''(ξ) for some ξ in the cell, so each cell stores twice
+    the midpoint defect of log(factor) as its bound. An error e in the
+    log is a relative error of about e in the factor. For the default grid
+    (rate step 1bp, rates -10%..20%, 1..120 years, ~12 MB) the largest
+    cell bound is about 3.2e-6, inside the default tolerance of 1e-5
+    (0.001%, or ten cents per $10,000); cells above the tolerance are
+    computed exactly.
+
+Usage:
+    python annuity_table.py        # build and save the default table, then
+                                   # check it against the exact functions
+
+Requires NumPy (see requirements.txt).
+"""
+
+import json
+import math
+import os
+
+import numpy as np
+
+from batch_algorithms import accumulation_factor_array, annuity_due_factor_array
+from retirement_algorithms import (
+    finallyRetired,
+    maximumExpensed,
+    accumulation_factor,
+    affordable_expense,
+    annuity_due_factor,
+    real_rate,
+    retirement_balance,
+)
+
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "annuity_table.npy")
+DEFAULT_RATE_RANGE = (-0.10, 0.20)
+DEFAULT_RATE_STEP = 0.0001
+DEFAULT_MAX_YEARS = 120
+DEFAULT_TOLERANCE = 1e-5
+
+# Layers of the stored (4, max_years + 1, n_rates) array: log-factors and
+# their per-cell error bounds. Row 0 (zero years) is unused: both factors
+# are exactly 0 there.
+_ACCUMULATION, _ANNUITY_DUE, _ACCUMULATION_ERROR, _ANNUITY_DUE_ERROR = range(4)
+
+
+class AnnuityTable:
+    """
+    Rate × years grid of accumulation and annuity-due factors.
+
+    Time Complexity: O(1) per query (two grid lookups and a blend)
+    Space Complexity: O(n_rates × max_years), memory-mapped when loaded
+
+    Example:
+        >>> table = load_or_build()
+        >>> table.fixed_investor(7500, 0.05, 3)        # ≈ fixedInvestor
+        >>> table.maximum_expense(500000, 0.04, 25)    # ≈ maximumExpensed
+    """
+
+    def __init__(self, layers, rate_min, rate_step, tolerance=DEFAULT_TOLERANCE):
+        """
+        Wrap an existing layer array; use build() or load() to create one.
+
+        Parameters:
+            layers (numpy.ndarray): Shape (4, max_years + 1, n_rates)
+            rate_min (float): Rate of the first grid column
+            rate_step (float): Spacing between grid columns (must be > 0)
+            tolerance (float): Largest accepted relative error bound
+
+        Raises:
+            ValueError: If the layer shape or grid parameters are invalid
+        """
+        if layers.ndim != 3 or layers.shape[0] != 4 or layers.shape[2] < 2:
+            raise ValueError(f"Table layers must have shape (4, years, rates >= 2): {layers.shape}")
+        if rate_step <= 0:
+            raise ValueError(f"Rate step must be positive: {rate_step}")
+        if tolerance < 0:
+            raise ValueError(f"Tolerance cannot be negative: {tolerance}")
+
+        self.layers = layers
+        self.rate_min = float(rate_min)
+        self.rate_step = float(rate_step)
+        self.tolerance = float(tolerance)
+        self.max_years = layers.shape[1] - 1
+        self.rate_max = self.rate_min + self.rate_step * (layers.shape[2] - 1)
+        self.stats = {"table_hits": 0, "exact_fallbacks": 0}
+
+    @classmethod
+    def build(cls, rate_range=DEFAULT_RATE_RANGE, rate_step=DEFAULT_RATE_STEP,
+              max_years=DEFAULT_MAX_YEARS, tolerance=DEFAULT_TOLERANCE):
+        """
+        Compute the table in one vectorized pass.
+
+        Time Complexity: O(n_rates × max_years)
+
+        Raises:
+            ValueError: If the grid is empty or reaches a rate <= -100%
+        """
+        rate_min, rate_max = rate_range
+        if rate_min <= -1.0 or rate_max <= rate_min:
+            raise ValueError(f"Rate range must satisfy -1 < min < max: {rate_range}")
+        if max_years < 1:
+            raise ValueError(f"max_years must be at least 1: {max_years}")
+
+        n_rates = int(round((rate_max - rate_min) / rate_step)) + 1
+        rates = rate_min + rate_step * np.arange(n_rates)
+        midpoints = rates[:-1] + rate_step / 2.0
+        years = np.arange(max_years + 1)[:, None]
+
+        layers = np.zeros((4, max_years + 1, n_rates))
+        for factor_layer, error_layer, factor_function in (
+            (_ACCUMULATION, _ACCUMULATION_ERROR, accumulation_factor_array),
+            (_ANNUITY_DUE, _ANNUITY_DUE_ERROR, annuity_due_factor_array),
+        ):
+            with np.errstate(divide="ignore"):
+                log_grid = np.log(factor_function(rates[None, :], years))
+                log_midpoints = np.log(factor_function(midpoints[None, :], years))
+            log_grid[0] = 0.0
+            log_midpoints[0] = 0.0
+
+            layers[factor_layer] = log_grid
+            # Cell i (between columns i and i + 1) keeps its bound in column i
+            layers[error_layer, :, :-1] = 2.0 * np.abs(
+                log_midpoints - (log_grid[:, :-1] + log_grid[:, 1:]) / 2.0
+            )
+
+        return cls(layers, rate_min, rate_step, tolerance)
+
+    def save(self, path=DEFAULT_TABLE_PATH):
+        """Write the layers (.npy) and grid parameters (.json sidecar)."""
+        np.save(path, self.layers)
+        with open(_metadata_path(path), "w") as handle:
+            json.dump({"rate_min": self.rate_min, "rate_step": self.rate_step}, handle)
+
+    @classmethod
+    def load(cls, path=DEFAULT_TABLE_PATH, tolerance=DEFAULT_TOLERANCE):
+        """Memory-map a saved table; only the touched pages are read."""
+        with open(_metadata_path(path)) as handle:
+            metadata = json.load(handle)
+        layers = np.load(path, mmap_mode="r")
+        return cls(layers, metadata["rate_min"], metadata["rate_step"], tolerance)
+
+    # ============================================
+    # QUERIES
+    # ============================================
+
+    def accumulation_factor(self, rate, years):
+        """A(rate, years), interpolated or exact (see module docstring)."""
+        return self._lookup(_ACCUMULATION, _ACCUMULATION_ERROR, rate, years,
+                            accumulation_factor)[0]
+
+    def annuity_due_factor(self, rate, years):
+        """ä(rate, years), interpolated or exact (see module docstring)."""
+        return self._lookup(_ANNUITY_DUE, _ANNUITY_DUE_ERROR, rate, years,
+                            annuity_due_factor)[0]
+
+    def fixed_investor(self, principal, rate, years):
+        """
+        Table-backed fixedInvestor(principal, rate, years).
+
+        Raises:
+            ValueError: If principal or years is negative, or rate < -1
+        """
+        if principal < 0:
+            raise ValueError(f"Principal cannot be negative: {principal}")
+        if rate < -1.0:
+            raise ValueError(f"Rate cannot be less than -100%: {rate}")
+        if years < 0:
+            raise ValueError(f"Years cannot be negative: {years}")
+
+        return principal * self.accumulation_factor(rate, years)
+
+    def maximum_expense(self, balance, rate, target_years, inflation=0.0,
+                        return_method=False):
+        """
+        Table-backed maximumExpensed(balance, rate, target_years, inflation=...).
+
+        balance / ä(n) is read from the table, lowered by the cell's error
+        bound and stepped down with affordable_expense until it lasts
+        target_years, so it is at most the exact answer (lower by at most
+        twice the cell's error bound). Near a
+        perpetuity that small shortfall can buy extra years; when it would
+        last past target_years the exact formula answers instead. Targets the annuity formula cannot answer
+        (non-integer years, real rate of -100%) are passed to
+        maximumExpensed, which bisects.
+
+        Returns:
+            float, or (expense, path) when return_method is True, where
+            path is "analytic" or "bisection" as in maximumExpensed
+
+        Raises:
+            ValueError: If balance <= 0, target_years <= 0, rate < -1 or
+                        inflation <= -1
+        """
+        if balance <= 0:
+            raise ValueError(f"Balance must be positive: {balance}")
+        if target_years <= 0:
+            raise ValueError(f"Target years must be positive: {target_years}")
+        if rate < -1.0:
+            raise ValueError(f"Rate cannot be less than -100%: {rate}")
+        if inflation <= -1.0:
+            raise ValueError(f"Inflation must be greater than -100%: {inflation}")
+
+        real_growth = real_rate(rate, inflation)
+        if real_growth <= -1.0 or not float(target_years).is_integer():
+            self.stats["exact_fallbacks"] += 1
+            return maximumExpensed(balance, rate, target_years, inflation=inflation,
+                                   return_method=return_method)
+
+        target_years = int(target_years)
+        factor, bound = self._lookup(_ANNUITY_DUE, _ANNUITY_DUE_ERROR, real_growth,
+                                     target_years, annuity_due_factor)
+        # Lowering by the bound lands on the lasting side almost always, so
+        # affordable_expense usually stops after one check
+        expense = affordable_expense(balance, balance / factor * (1.0 - bound),
+                                      real_growth, target_years)
+        # It lasts at least target_years; a balance still >= expense after
+        # the last withdrawal means it lasts longer
+        if retirement_balance(balance, expense, real_growth, target_years) >= expense:
+            self.stats["exact_fallbacks"] += 1
+            expense = maximumExpensed(balance, real_growth, target_years)
+        return (expense, "analytic") if return_method else expense
+
+    def _lookup(self, factor_layer, error_layer, rate, years, exact_function):
+        """
+        Linear interpolation of log(factor) across the rate, exact fallback.
+
+        Returns (factor, bound): the relative error bound of the factor,
+        0.0 when it was computed exactly.
+
+        Raises:
+            ValueError: If years is not a whole number (the exact factors
+                        are only defined there)
+        """
+        if not float(years).is_integer():
+            raise ValueError(f"Years must be a whole number: {years}")
+        years = int(years)
+        if years == 0:
+            return 0.0, 0.0
+
+        position = (rate - self.rate_min) / self.rate_step
+        in_grid = (0.0 <= position <= self.layers.shape[2] - 1
+                   and 1 <= years <= self.max_years)
+
+        if in_grid:
+            column = min(int(position), self.layers.shape[2] - 2)
+            rate_weight = position - column
+
+            # item() reads single cells without creating NumPy scalars
+            cell = self.layers.item
+            if cell(error_layer, years, column) <= self.tolerance:
+                self.stats["table_hits"] += 1
+                return (math.exp(cell(factor_layer, years, column) * (1 - rate_weight)
+                                 + cell(factor_layer, years, column + 1) * rate_weight),
+                        cell(error_layer, years, column))
+
+        self.stats["exact_fallbacks"] += 1
+        return exact_function(rate, years), 0.0
+
+
+def load_or_build(path=DEFAULT_TABLE_PATH, tolerance=DEFAULT_TOLERANCE):
+    """
+    Memory-map the table at `path`, building and saving it first if missing.
+    """
+    if not os.path.exists(path) or not os.path.exists(_metadata_path(path)):
+        AnnuityTable.build(tolerance=tolerance).save(path)
+    return AnnuityTable.load(path, tolerance)
+
+
+def _metadata_path(path):
+    """Location of the JSON sidecar holding the grid parameters."""
+    return os.path.splitext(path)[0] + ".json"
+
+
+if __name__ == "__main__":
+    table = AnnuityTable.build()
+    table.save()
+    worst_bound = max(table.layers[_ACCUMULATION_ERROR].max(),
+                      table.layers[_ANNUITY_DUE_ERROR].max())
+    print(f"Saved {DEFAULT_TABLE_PATH}: {table.layers.shape[2]} rates × "
+          f"{table.max_years + 1} years, worst cell bound {worst_bound:.2e}")
+
+    print("=" * 70)
+    print("ANNUITY TABLE vs EXACT FUNCTIONS")
+    print("=" * 70)
+
+    rng = np.random.default_rng(14)
+    n_queries = 2000
+    balances = rng.uniform(1e4, 1e7, n_queries)
+    rates = rng.uniform(-0.15, 0.25, n_queries)   # some outside the grid
+    targets = rng.integers(1, 130, n_queries)     # some past max_years
+
+    # Every table answer lasts exactly the target and is within tolerance
+    short, worst = 0, 0.0
+    for balance, rate, target in zip(balances, rates, targets):
+        expense = table.maximum_expense(balance, rate, int(target))
+        exact = maximumExpensed(balance, rate, int(target))
+        short += finallyRetired(balance, expense, rate) != target
+        worst = max(worst, (exact - expense) / exact)
+    print(f"maximum_expense: {short} of {n_queries} miss the target "
+          f"{'✓ PASS' if short == 0 else '✗ FAIL'}")
+    print(f"maximum_expense: worst shortfall vs maximumExpensed {worst:.2e} "
+          f"{'✓ PASS' if 0.0 <= worst <= 2.0 * table.tolerance else '✗ FAIL'}")
+
+    worst = max(
+        abs(table.fixed_investor(balance, rate, int(target))
+            - balance * accumulation_factor(rate, int(target)))
+        / (balance * accumulation_factor(rate, int(target)))
+        for balance, rate, target in zip(balances, rates, targets)
+    )
+    print(f"fixed_investor: worst relative error {worst:.2e} "
+          f"{'✓ PASS' if worst <= table.tolerance else '✗ FAIL'}")
+
+    # Non-integer targets and indexed withdrawals answer like maximumExpensed
+    for balance, rate, target, inflation in ((500000, 0.04, 25.5, 0.0),
+                                             (500000, 0.25, 25.5, 0.0),
+                                             (500000, 0.05, 30, 0.03)):
+        expense, path = table.maximum_expense(balance, rate, target, inflation=inflation,
+                                              return_method=True)
+        exact, exact_path = maximumExpensed(balance, rate, target, inflation=inflation,
+                                            return_method=True)
+        error = abs(expense - exact) / exact
+        print(f"maximum_expense({balance}, {rate}, {target}, inflation={inflation}): "
+              f"{expense:,.2f} vs {exact:,.2f} ({path}) "
+              f"{'✓ PASS' if path == exact_path and error <= table.tolerance else '✗ FAIL'}")
+
+    print("=" * 70)
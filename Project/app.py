@@ -1,11 +1,742 @@
-from flask import Flask
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Web Service
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+JSON API over the core algorithms (POST a JSON object, get one back):
+    /fixed-investor       {"principal", "rate", "years"}
+    /variable-investor    {"principal", "rates"}
+    /finally-retired      {"balance", "expense", "rate", "inflation"?}
+    /maximum-expensed     {"balance", "rate", "target_years"?, "inflation"?, "method"?}
+    /batch                {"algorithm", "scenarios": [{...}, ...]}
+
+Identical concurrent single-scenario requests share one computation
+(see single_flight.py); GET /stats/coalescing reports the counters.
+/maximum-expensed with method "auto" (the default) is answered from the
+annuity factor table memory-mapped at startup (see annuity_table.py;
+ANNUITY_TABLE_PATH sets the file, built on first start if missing);
+GET /stats/annuity-table reports its hit and fallback counters.
+
+/batch evaluates every scenario of one algorithm together with the
+vectorized functions in batch_algorithms.py. Invalid input is answered
+with 400 and {"error": message}; field types are checked at this boundary,
+so any other TypeError is a server error (500). Years that never run out
+(perpetuities) are reported as null, since JSON has no infinity.
+
+Streaming endpoints answer with newline-delimited JSON (one object per
+line), written as rows are computed:
+    /stream/batch         same request as /batch, STREAM_CHUNK_SIZE scenarios at a time
+    /stream/trajectory    {"algorithm", ...fields, "frequency"?, "max_years"?}
+    /stream/monte-carlo   {"principal", "n_paths", "n_years", ...}
+Input is validated before the first line is sent; an error found later
+ends the stream with an {"error": message} line.
+
+Long computations run as background jobs (see jobs.py):
+    POST   /jobs                 {"kind", "params"} -> 202 {"id", ...}
+    GET    /jobs/<id>            state and progress
+    GET    /jobs/<id>/result     result once the job has succeeded
+    DELETE /jobs/<id>            cancel
+The worker pool is sized by the JOB_WORKERS, JOB_MAX_ACTIVE and
+JOB_RESULT_TTL environment variables.
+
+Every compute request is priced by admission.estimate_cost. Cheap ones
+run immediately; costlier ones share a few slow-lane slots (503 when
+those and their queue are full); requests over the limit get 413 with
+the estimate (ADMISSION_* environment variables set the limits).
+"""
+
+import functools
+import inspect
+import itertools
+import json
+import math
+import os
+
+import numpy as np
+from flask import Flask, Response, jsonify, request
+
+from admission import (
+    DEFAULT_FAST_LANE_COST,
+    DEFAULT_MAX_COST,
+    DEFAULT_MAX_JOB_COST,
+    DEFAULT_SLOW_LANE_SLOTS,
+    AdmissionController,
+    AdmissionRejected,
+    CostLimitExceeded,
+    estimate_cost,
+)
+from annuity_table import DEFAULT_TABLE_PATH, load_or_build
+from batch_algorithms import (
+    fixedInvestor_batch,
+    variableInvestor_batch,
+    finallyRetired_batch,
+    maximumExpensed_batch,
+)
+from compounding import PERIODS_PER_YEAR
+from jobs import (
+    DEFAULT_MAX_ACTIVE_JOBS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_RESULT_TTL,
+    JOB_KINDS,
+    JobQueue,
+    JobQueueFull,
+    UnknownJob,
+)
+from monte_carlo import DEFAULT_PERCENTILES, iter_percentile_bands
+from retirement_algorithms import (
+    finallyRetired,
+    iter_fixed_balances,
+    iter_variable_balances,
+    iter_retirement_balances,
+)
+from single_flight import (
+    coalesced_fixedInvestor,
+    coalesced_variableInvestor,
+    coalesced_finallyRetired,
+    coalesced_maximumExpensed,
+)
 
 app = Flask(__name__)
 
+MAX_BATCH_SCENARIOS = 100_000
+STREAM_CHUNK_SIZE = 1_000
+
+_REQUIRED = object()
+
+job_queue = JobQueue(
+    max_workers=int(os.environ.get("JOB_WORKERS", DEFAULT_MAX_WORKERS)),
+    max_active_jobs=int(os.environ.get("JOB_MAX_ACTIVE", DEFAULT_MAX_ACTIVE_JOBS)),
+    result_ttl=float(os.environ.get("JOB_RESULT_TTL", DEFAULT_RESULT_TTL)),
+)
+
+admission = AdmissionController(
+    fast_lane_cost=int(os.environ.get("ADMISSION_FAST_LANE_COST", DEFAULT_FAST_LANE_COST)),
+    max_cost=int(os.environ.get("ADMISSION_MAX_COST", DEFAULT_MAX_COST)),
+    slow_lane_slots=int(os.environ.get("ADMISSION_SLOW_LANE_SLOTS", DEFAULT_SLOW_LANE_SLOTS)),
+)
+MAX_JOB_COST = int(os.environ.get("ADMISSION_MAX_JOB_COST", DEFAULT_MAX_JOB_COST))
+
+annuity_table = load_or_build(os.environ.get("ANNUITY_TABLE_PATH", DEFAULT_TABLE_PATH))
+
+
+def admitted(kind):
+    """
+    Decorator: price the request body as `kind` and run the view only once
+    admission allows it. For streamed responses the slot is held until the
+    stream is closed, not just until the view returns.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            cost = estimate_cost(kind, request.get_json(silent=True))
+            lane = admission.acquire(cost, hint="submit it to POST /jobs instead")
+            try:
+                response = app.make_response(view(*args, **kwargs))
+            except BaseException:
+                admission.release(lane)
+                raise
+            if response.is_streamed:
+                response.call_on_close(lambda: admission.release(lane))
+            else:
+                admission.release(lane)
+            return response
+        return wrapper
+    return decorator
+
+
 @app.route("/")
 def home():
     return "Hello, AOFAGroupProject! Your Python project is deployed successfully."
 
+
+# ============================================
+# SINGLE-SCENARIO ENDPOINTS
+# ============================================
+
+@app.post("/fixed-investor")
+@admitted("fixedInvestor")
+def fixed_investor():
+    payload = _json_body()
+    balance = coalesced_fixedInvestor(
+        _number(payload, "principal"),
+        _number(payload, "rate"),
+        _integer(payload, "years"),
+    )
+    return jsonify({"balance": _json_number(balance)})
+
+
+@app.post("/variable-investor")
+@admitted("variableInvestor")
+def variable_investor():
+    payload = _json_body()
+    balance = coalesced_variableInvestor(_number(payload, "principal"),
+                                         _number_list(payload, "rates"))
+    return jsonify({"balance": _json_number(balance)})
+
+
+@app.post("/finally-retired")
+@admitted("finallyRetired")
+def finally_retired():
+    payload = _json_body()
+    years = coalesced_finallyRetired(
+        _number(payload, "balance"),
+        _number(payload, "expense"),
+        _number(payload, "rate"),
+        inflation=_number(payload, "inflation", 0.0),
+    )
+    return jsonify({"years": _json_number(years), "perpetuity": math.isinf(years)})
+
+
+@app.post("/maximum-expensed")
+@admitted("maximumExpensed")
+def maximum_expensed():
+    payload = _json_body()
+    balance = _number(payload, "balance")
+    rate = _number(payload, "rate")
+    target_years = _number(payload, "target_years", 20)
+    method = _string(payload, "method", "auto")
+    inflation = _number(payload, "inflation", 0.0)
+
+    # The table lookup is O(1), so it is not worth coalescing
+    if method == "auto":
+        expense, path = annuity_table.maximum_expense(
+            balance, rate, target_years, inflation=inflation, return_method=True
+        )
+    else:
+        expense, path = coalesced_maximumExpensed(
+            balance, rate, target_years, method=method, return_method=True,
+            inflation=inflation,
+        )
+    return jsonify({"expense": expense, "method": path})
+
+
+@app.get("/stats/admission")
+def admission_stats():
+    """Admission counters per lane plus the configured limits."""
+    return jsonify({
+        **admission.info(),
+        "fast_lane_cost": admission.fast_lane_cost,
+        "max_cost": admission.max_cost,
+        "max_job_cost": MAX_JOB_COST,
+        "slow_lane_slots": admission.slow_lane_slots,
+    })
+
+
+@app.get("/stats/annuity-table")
+def annuity_table_stats():
+    """Annuity table lookups answered from the grid vs computed exactly."""
+    return jsonify({**annuity_table.stats, "tolerance": annuity_table.tolerance})
+
+
+@app.get("/stats/coalescing")
+def coalescing_stats():
+    """Single-flight counters per algorithm (calls = executions + coalesced)."""
+    return jsonify({
+        name: function.flight_info()._asdict()
+        for name, function in (
+            ("fixedInvestor", coalesced_fixedInvestor),
+            ("variableInvestor", coalesced_variableInvestor),
+            ("finallyRetired", coalesced_finallyRetired),
+            ("maximumExpensed", coalesced_maximumExpensed),
+        )
+    })
+
+
+# ============================================
+# BATCH ENDPOINT
+# ============================================
+
+@app.post("/batch")
+@admitted("batch")
+def batch():
+    """
+    Evaluate many scenarios of one algorithm in a single vectorized call.
+
+    Request:  {"algorithm": "maximumExpensed",
+               "scenarios": [{"balance": 500000, "rate": 0.04, "target_years": 25}, ...]}
+    Response: {"algorithm": ..., "count": n, "results": [value per scenario]}
+
+    Scenario fields are the same as the single-scenario endpoints.
+    """
+    algorithm, scenarios = _batch_request(_json_body())
+
+    results = _BATCH_EVALUATORS[algorithm](scenarios)
+    return jsonify({
+        "algorithm": algorithm,
+        "count": len(scenarios),
+        "results": [_json_number(value) for value in results.tolist()],
+    })
+
+
+def _batch_request(payload):
+    """Validated (algorithm, scenarios) of a /batch request."""
+    algorithm = _string(payload, "algorithm")
+    scenarios = _field(payload, "scenarios")
+
+    if algorithm not in _BATCH_EVALUATORS:
+        raise ValueError(
+            f"algorithm must be one of {', '.join(_BATCH_EVALUATORS)}: {algorithm}"
+        )
+    if not isinstance(scenarios, list) or not scenarios:
+        raise ValueError("scenarios must be a non-empty list")
+    if len(scenarios) > MAX_BATCH_SCENARIOS:
+        raise ValueError(f"At most {MAX_BATCH_SCENARIOS} scenarios per batch: {len(scenarios)}")
+
+    return algorithm, scenarios
+
+
+def _batch_fixed_investor(scenarios):
+    return fixedInvestor_batch(
+        _column(scenarios, "principal"),
+        _column(scenarios, "rate"),
+        _column(scenarios, "years", integer=True),
+    )
+
+
+def _batch_variable_investor(scenarios):
+    rate_lists = _column(scenarios, "rates", as_array=False)
+    for index, rates in enumerate(rate_lists):
+        if not _is_number_list(rates):
+            raise ValueError(f"Scenario {index} field rates must be a list of numbers")
+    if len({len(rates) for rates in rate_lists}) != 1:
+        raise ValueError("All scenarios must have the same number of rates")
+    return variableInvestor_batch(_column(scenarios, "principal"), rate_lists)
+
+
+def _batch_finally_retired(scenarios):
+    return finallyRetired_batch(
+        _column(scenarios, "balance"),
+        _column(scenarios, "expense"),
+        _column(scenarios, "rate"),
+        _column(scenarios, "inflation", 0.0),
+    )
+
+
+def _batch_maximum_expensed(scenarios):
+    return maximumExpensed_batch(
+        _column(scenarios, "balance"),
+        _column(scenarios, "rate"),
+        _column(scenarios, "target_years", 20),
+        inflation=_column(scenarios, "inflation", 0.0),
+    )
+
+
+_BATCH_EVALUATORS = {
+    "fixedInvestor": _batch_fixed_investor,
+    "variableInvestor": _batch_variable_investor,
+    "finallyRetired": _batch_finally_retired,
+    "maximumExpensed": _batch_maximum_expensed,
+}
+
+
+# ============================================
+# STREAMING (NDJSON) ENDPOINTS
+# ============================================
+
+@app.post("/stream/batch")
+@admitted("batch")
+def stream_batch():
+    """
+    /batch as a stream: one {"index", "result"} line per scenario.
+
+    Scenarios are evaluated STREAM_CHUNK_SIZE at a time, so the first
+    lines go out after one chunk instead of after the whole batch.
+    """
+    algorithm, scenarios = _batch_request(_json_body())
+    evaluate = _BATCH_EVALUATORS[algorithm]
+
+    def rows():
+        for start in range(0, len(scenarios), STREAM_CHUNK_SIZE):
+            results = evaluate(scenarios[start:start + STREAM_CHUNK_SIZE])
+            for offset, value in enumerate(results.tolist()):
+                yield {"index": start + offset, "result": _json_number(value)}
+
+    return _ndjson_response(rows())
+
+
+@app.post("/stream/trajectory")
+@admitted("trajectory")
+def stream_trajectory():
+    """
+    Year-by-year (or period-by-period) balance path of one scenario.
+
+    Request: {"algorithm": "fixedInvestor" | "variableInvestor" | "finallyRetired",
+              ...that algorithm's fields, "frequency"?: "annual" | "monthly" | "daily",
+              "max_years"?: cap on the path length}
+    Lines:   {"period", "year", "balance", "cash_flow", "growth"}
+
+    Sub-annual frequencies split each year's rate and cash flow evenly
+    over its periods, as in compounding.py; inflation is applied per
+    period at the equivalent rate (1 + inflation)^(1/m) - 1.
+    finallyRetired paths that never deplete need max_years.
+    """
+    payload = _json_body()
+    algorithm = _string(payload, "algorithm")
+    frequency = _string(payload, "frequency", "annual")
+    max_years = _number(payload, "max_years", None)
+
+    if frequency not in PERIODS_PER_YEAR:
+        raise ValueError(f"frequency must be one of {', '.join(PERIODS_PER_YEAR)}: {frequency}")
+    periods_per_year = PERIODS_PER_YEAR[frequency]
+    max_periods = None if max_years is None else int(max_years * periods_per_year)
+
+    # Annual inputs are validated before they are split into periods: a
+    # -500% annual rate is a legal-looking -41.7% per month
+    if algorithm == "fixedInvestor":
+        principal = _number(payload, "principal")
+        rate = _number(payload, "rate")
+        years = _integer(payload, "years")
+        if principal < 0:
+            raise ValueError(f"Principal cannot be negative: {principal}")
+        if rate < -1.0:
+            raise ValueError(f"Rate cannot be less than -100%: {rate}")
+        path = iter_fixed_balances(
+            principal / periods_per_year,
+            rate / periods_per_year,
+            years * periods_per_year,
+        )
+    elif algorithm == "variableInvestor":
+        rates = _number_list(payload, "rates")
+        if not rates:
+            raise ValueError("rates must be a non-empty list")
+        _check_annual_rates(rates)
+        path = iter_variable_balances(
+            _number(payload, "principal"),
+            (rate / periods_per_year for rate in rates for _ in range(periods_per_year)),
+        )
+    elif algorithm == "finallyRetired":
+        balance = _number(payload, "balance")
+        expense = _number(payload, "expense")
+        rate = _number(payload, "rate")
+        if expense < 0:
+            raise ValueError(f"Expense cannot be negative: {expense}")
+        if rate < -1.0:
+            raise ValueError(f"Rate cannot be less than -100%: {rate}")
+        expense /= periods_per_year
+        rate /= periods_per_year
+        inflation = _number(payload, "inflation", 0.0)
+        if inflation > -1.0:
+            inflation = (1.0 + inflation) ** (1.0 / periods_per_year) - 1.0
+        if max_periods is None and math.isinf(
+            finallyRetired(balance, expense, rate, inflation=inflation)
+        ):
+            raise ValueError("This plan never depletes; pass max_years to bound the path")
+        path = iter_retirement_balances(balance, expense, rate, inflation, max_periods)
+    else:
+        raise ValueError(
+            "algorithm must be one of fixedInvestor, variableInvestor, finallyRetired: "
+            f"{algorithm}"
+        )
+
+    if max_periods is not None:
+        if max_periods < 0:
+            raise ValueError(f"max_years cannot be negative: {max_years}")
+        path = itertools.islice(path, max_periods)
+
+    def rows():
+        for period, balance, cash_flow, growth in path:
+            yield {
+                "period": period,
+                "year": period / periods_per_year,
+                "balance": _json_number(balance),
+                "cash_flow": cash_flow,
+                "growth": _json_number(growth),
+            }
+
+    return _ndjson_response(rows())
+
+
+@app.post("/stream/monte-carlo")
+@admitted("monte_carlo")
+def stream_monte_carlo():
+    """
+    Percentile bands of a Monte Carlo variableInvestor, one line per year.
+
+    Request: {"principal", "n_paths", "n_years", "distribution"?, "mean"?,
+              "volatility"?, "history"?, "percentiles"?, "seed"?}
+    Lines:   {"year", "percentiles": {"5": balance, "50": ..., ...}}
+
+    Memory stays O(n_paths) however many years are requested
+    (see monte_carlo.iter_percentile_bands).
+    """
+    payload = _json_body()
+    bands = iter_percentile_bands(
+        _number(payload, "principal"),
+        _integer(payload, "n_paths"),
+        _integer(payload, "n_years"),
+        distribution=_string(payload, "distribution", "normal"),
+        mean=_number(payload, "mean", 0.05),
+        volatility=_number(payload, "volatility", 0.15),
+        history=_number_list(payload, "history", None),
+        percentiles=_number_list(payload, "percentiles", DEFAULT_PERCENTILES),
+        seed=_integer(payload, "seed", None),
+    )
+
+    def rows():
+        for year, values in bands:
+            yield {
+                "year": year,
+                "percentiles": {str(key): _json_number(value) for key, value in values.items()},
+            }
+
+    return _ndjson_response(rows())
+
+
+def _ndjson_response(rows):
+    """
+    Stream dict rows as newline-delimited JSON.
+
+    Errors raised while streaming cannot change the status code any more,
+    so they are sent as a final {"error": message} line instead.
+    """
+    def lines():
+        try:
+            for row in rows:
+                yield json.dumps(row) + "\n"
+        except ValueError as error:
+            yield json.dumps({"error": str(error)}) + "\n"
+
+    return Response(lines(), mimetype="application/x-ndjson")
+
+
+# ============================================
+# BACKGROUND JOBS
+# ============================================
+
+@app.post("/jobs")
+def submit_job():
+    """
+    Queue a job: {"kind": "monte_carlo" | "maximum_expensed_batch" |
+    "withdrawal_frontier", "params": {...}}. Params are the keyword
+    arguments of the matching jobs.plan_* function.
+    """
+    payload = _json_body()
+    kind, params = _string(payload, "kind"), _field(payload, "params")
+    if kind in JOB_KINDS:
+        _check_job_params(kind, params)
+        admission.check(estimate_cost(f"job:{kind}", params), MAX_JOB_COST)
+    job_id = job_queue.submit(kind, params)
+    return jsonify(job_queue.status(job_id)), 202
+
+
+@app.get("/jobs/<job_id>")
+def job_status(job_id):
+    return jsonify(job_queue.status(job_id))
+
+
+@app.get("/jobs/<job_id>/result")
+def job_result(job_id):
+    job = job_queue.result(job_id)
+    if job["state"] != "succeeded":
+        return jsonify(job), 409
+    return jsonify(_json_value(job))
+
+
+@app.delete("/jobs/<job_id>")
+def cancel_job(job_id):
+    cancelled = job_queue.cancel(job_id)
+    return jsonify({**job_queue.status(job_id), "cancelled": cancelled})
+
+
+# ============================================
+# REQUEST PARSING AND ERRORS
+# ============================================
+
+def _json_body():
+    """The request's JSON object, or ValueError if there is none."""
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+    return payload
+
+
+def _field(payload, name, default=_REQUIRED):
+    """payload[name], its default when optional, or ValueError when missing."""
+    if name in payload:
+        return payload[name]
+    if default is _REQUIRED:
+        raise ValueError(f"Missing required field: {name}")
+    return default
+
+
+def _number(payload, name, default=_REQUIRED):
+    """_field() that must be a JSON number (or null when the default is None)."""
+    return _typed_field(payload, name, default, _is_number, "a number")
+
+
+def _integer(payload, name, default=_REQUIRED):
+    """_field() that must be a whole JSON number (or null when the default is None)."""
+    return _typed_field(payload, name, default, _is_integer, "an integer")
+
+
+def _string(payload, name, default=_REQUIRED):
+    """_field() that must be a JSON string."""
+    return _typed_field(payload, name, default, lambda value: isinstance(value, str),
+                        "a string")
+
+
+def _number_list(payload, name, default=_REQUIRED):
+    """_field() that must be a list of JSON numbers (or null when the default is None)."""
+    return _typed_field(payload, name, default, _is_number_list, "a list of numbers")
+
+
+def _typed_field(payload, name, default, is_valid, description):
+    """_field(), raising ValueError unless the client's value passes is_valid()."""
+    value = _field(payload, name, default)
+    if name not in payload or (value is None and default is None):
+        return value
+    if not is_valid(value):
+        raise ValueError(f"Field {name} must be {description}: {value!r}")
+    return value
+
+
+def _is_number(value):
+    """
+    True for finite JSON numbers. bool is an int in Python but not a number
+    here, and NaN/Infinity (which Python's JSON parser accepts) are rejected.
+    """
+    return (isinstance(value, (int, float)) and not isinstance(value, bool)
+            and math.isfinite(value))
+
+
+def _is_integer(value):
+    """True for whole JSON numbers written without a fraction."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number_list(value):
+    """True for a flat list of numbers."""
+    return isinstance(value, list) and all(_is_number(item) for item in value)
+
+
+def _is_number_array(value):
+    """True for a number or a (nested) list of numbers."""
+    if isinstance(value, list):
+        return all(_is_number_array(item) for item in value)
+    return _is_number(value)
+
+
+# JSON types of the job parameters; any other parameter is a single number
+_JOB_ARRAY_PARAMS = {"balances", "rates", "target_years", "inflation", "history", "percentiles"}
+_JOB_INTEGER_PARAMS = {"n_paths", "n_years", "max_years", "seed", "shard_size", "chunk_size"}
+_JOB_STRING_PARAMS = {"distribution"}
+
+
+def _check_job_params(kind, params):
+    """
+    Check job params against the planner's signature: known names, no
+    missing required ones, and JSON types. The planner checks the values.
+    """
+    if not isinstance(params, dict):
+        raise ValueError("params must be an object")
+
+    accepted = inspect.signature(JOB_KINDS[kind]).parameters
+    for name, parameter in accepted.items():
+        if parameter.default is inspect.Parameter.empty and name not in params:
+            raise ValueError(f"Missing required param for {kind}: {name}")
+
+    for name, value in params.items():
+        if name not in accepted:
+            raise ValueError(f"Unknown param for {kind}: {name}")
+        if value is None and accepted[name].default is None:
+            continue
+        if name in _JOB_STRING_PARAMS:
+            valid, description = isinstance(value, str), "a string"
+        elif name in _JOB_INTEGER_PARAMS:
+            valid, description = _is_integer(value), "an integer"
+        elif name in _JOB_ARRAY_PARAMS:
+            valid, description = _is_number_array(value), "a number or a list of numbers"
+        else:
+            valid, description = _is_number(value), "a number"
+        if not valid:
+            raise ValueError(f"Param {name} must be {description}: {value!r}")
+
+
+def _check_annual_rates(rates):
+    """Reject rates below -100%, naming the first bad one."""
+    for index, rate in enumerate(rates):
+        if rate < -1.0:
+            raise ValueError(f"Rate at index {index} cannot be less than -100%: {rate}")
+
+
+def _column(scenarios, name, default=_REQUIRED, as_array=True, integer=False):
+    """
+    One field of every scenario, as a NumPy array of numbers (integers when
+    integer=True), or as a list of raw values when as_array=False.
+    """
+    values = []
+    for index, scenario in enumerate(scenarios):
+        if not isinstance(scenario, dict):
+            raise ValueError(f"Scenario {index} must be a JSON object")
+        if name in scenario:
+            values.append(scenario[name])
+        elif default is _REQUIRED:
+            raise ValueError(f"Scenario {index} is missing required field: {name}")
+        else:
+            values.append(default)
+
+    if not as_array:
+        return values
+    is_valid = _is_integer if integer else _is_number
+    for index, value in enumerate(values):
+        if not is_valid(value):
+            raise ValueError(
+                f"Scenario {index} field {name} must be {'an integer' if integer else 'a number'}: "
+                f"{value!r}"
+            )
+    return np.array(values)
+
+
+def _json_number(value):
+    """JSON has no infinity or NaN: report them as null."""
+    return value if math.isfinite(value) else None
+
+
+def _json_value(value):
+    """Recursively convert NumPy arrays/scalars and non-finite floats for JSON."""
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    elif isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, dict):
+        return {str(key): _json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, float):
+        return _json_number(value)
+    return value
+
+
+@app.errorhandler(ValueError)
+def invalid_input(error):
+    return jsonify({"error": str(error)}), 400
+
+
+@app.errorhandler(UnknownJob)
+def unknown_job(error):
+    return jsonify({"error": f"Unknown or expired job: {error.args[0]}"}), 404
+
+
+@app.errorhandler(JobQueueFull)
+def job_queue_full(error):
+    return jsonify({"error": str(error)}), 429
+
+
+@app.errorhandler(CostLimitExceeded)
+def cost_limit_exceeded(error):
+    return jsonify({"error": str(error), "cost": error.cost, "limit": error.limit}), 413
+
+
+@app.errorhandler(AdmissionRejected)
+def admission_rejected(error):
+    return jsonify({"error": str(error)}), 503, {"Retry-After": "1"}
+
+
 if __name__ == "__main__":
     # Only used if running locally
     app.run(host="0.0.0.0", port=8000, debug=True)
@@ -0,0 +1,232 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Historical Backtesting
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module answers "how would this finallyRetired plan have done starting
+in each historical year?" (sequence-of-returns risk):
+- An annual return series is loaded from a CSV file
+- Every start year's window of returns becomes one row of a matrix
+- All rows run the withdraw-then-grow recurrence together (simulate_ruin)
+- Each start runs over all the history after it, so plans that pass the
+  target still report when (or whether) they would have run out
+
+Requires NumPy (see requirements.txt).
+"""
+
+import csv
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from batch_algorithms import check_rates
+from monte_carlo import simulate_ruin
+
+
+def load_return_series(path):
+    """
+    Load an annual return series from a CSV file.
+
+    Accepted layouts (a non-numeric header row is skipped):
+        year,rate     e.g. "1928,0.4381"
+        rate          one rate per line; years are numbered 0, 1, 2, ...
+
+    Rates are decimals (0.05 for 5%), in chronological order.
+
+    Parameters:
+        path (str): Path to the CSV file
+
+    Returns:
+        tuple: (years, rates) as numpy.ndarray of int and float
+
+    Raises:
+        ValueError: If the file has no data rows, rows have inconsistent
+                    column counts, or any rate < -1
+    """
+    rows = []
+    with open(path, newline="") as handle:
+        for line_number, row in enumerate(csv.reader(handle), 1):
+            row = [cell.strip() for cell in row if cell.strip()]
+            if not row:
+                continue
+            try:
+                rows.append([float(cell) for cell in row])
+            except ValueError:
+                # Header row (or any other non-numeric line) at the top
+                if rows:
+                    raise ValueError(f"Non-numeric value on line {line_number}: {row}")
+
+    if not rows:
+        raise ValueError(f"No return data found in {path}")
+    if len({len(row) for row in rows}) != 1 or len(rows[0]) not in (1, 2):
+        raise ValueError("Each row must be either 'rate' or 'year,rate'")
+
+    data = np.array(rows)
+    if data.shape[1] == 2:
+        years, rates = data[:, 0].astype(int), data[:, 1]
+    else:
+        years, rates = np.arange(len(data)), data[:, 0]
+
+    check_rates(rates)
+
+    return years, rates
+
+
+def backtest_withdrawal_plan(balance, expense, rates, target_years, start_years=None):
+    """
+    Run a finallyRetired plan from every historical start year at once.
+
+    Algorithm:
+        1. Build a (n_starts, target_years) matrix whose row i is
+           rates[i : i + target_years] (a strided view, no copying) and run
+           the withdraw-then-grow recurrence on all rows together: success
+           and the balance after target_years
+        2. Run the same recurrence over each start's remaining history,
+           rates[i:], to find the actual depletion year; rows are padded
+           past the end of the data, and depletions that happen only in
+           the padding are reported as inf (lasted all observed history)
+        3. Rank the starts by depletion year, then by balance after
+           target_years, so that starts which never deplete are ordered too
+
+    Only start years with a full target_years of history are tested.
+
+    Time Complexity: O(n_starts × n_rates)
+    Space Complexity: O(n_rates) for the strided rate windows, plus
+                      O(n_starts) per result array
+
+    Parameters:
+        balance (float): Initial retirement balance (must be >= 0)
+        expense (float): Annual withdrawal (must be >= 0)
+        rates (array_like): Annual returns in chronological order
+        target_years (int): Years the plan must last (1..len(rates))
+        start_years (array_like): Labels for rates (e.g. calendar years);
+                                  defaults to 0, 1, 2, ...
+
+    Returns:
+        dict: {
+            "start_years": numpy.ndarray, label of each tested start,
+            "depletion_years": numpy.ndarray, years survived per start
+                over all the history after it; inf if it never ran out,
+            "terminal_balances": numpy.ndarray, balance after target_years
+                (or at depletion, below expense),
+            "worst": float, "median": float, "best": float, depletion
+                years of the worst, median and best ranked starts,
+            "worst_start_year": label of the start with the worst outcome,
+            "best_start_year": label of the start with the best outcome,
+            "failing_start_years": numpy.ndarray, starts lasting < target_years,
+            "success_rate": float, share of starts lasting target_years,
+        }
+
+    Raises:
+        ValueError: On invalid inputs
+
+    Example:
+        >>> years, rates = load_return_series("sp500_annual.csv")
+        >>> result = backtest_withdrawal_plan(1000000, 40000, rates, 30, years)
+        >>> result["failing_start_years"]
+    """
+    rates = np.asarray(rates, dtype=float)
+
+    # Input validation
+    if rates.ndim != 1 or rates.size == 0:
+        raise ValueError(f"rates must be a non-empty 1-D series: shape {rates.shape}")
+    if not 1 <= target_years <= len(rates):
+        raise ValueError(f"Target years must be between 1 and {len(rates)}: {target_years}")
+    if start_years is None:
+        start_years = np.arange(len(rates))
+    start_years = np.asarray(start_years)
+    if start_years.shape != rates.shape:
+        raise ValueError("start_years must have one label per rate")
+
+    # Row i is the return sequence experienced by a retiree starting at i
+    rate_windows = sliding_window_view(rates, target_years)
+    tested_starts = start_years[:len(rate_windows)]
+
+    ruin = simulate_ruin(balance, expense, rate_windows, target_years=target_years)
+
+    # Row i continues with rates[i:]; the zero padding past the data only
+    # fills out the matrix and is never counted (see below)
+    padded_rates = np.concatenate([rates, np.zeros(len(rates) - 1)])
+    history_windows = sliding_window_view(padded_rates, len(rates))[:len(rate_windows)]
+    depletion_years = simulate_ruin(balance, expense, history_windows)["depletion_years"]
+    remaining_years = len(rates) - np.arange(len(rate_windows))
+    depletion_years[depletion_years > remaining_years] = np.inf
+
+    # Depletion year first, then the balance after target_years
+    ranking = np.lexsort((ruin["terminal_balances"], depletion_years))
+    worst_index, best_index = int(ranking[0]), int(ranking[-1])
+    median_index = int(ranking[len(ranking) // 2])
+    failing = depletion_years < target_years
+
+    return {
+        "start_years": tested_starts,
+        "depletion_years": depletion_years,
+        "terminal_balances": ruin["terminal_balances"],
+        "worst": float(depletion_years[worst_index]),
+        "median": float(depletion_years[median_index]),
+        "best": float(depletion_years[best_index]),
+        "worst_start_year": tested_starts[worst_index].item(),
+        "best_start_year": tested_starts[best_index].item(),
+        "failing_start_years": tested_starts[failing],
+        "success_rate": ruin["success_rate"],
+    }
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    from retirement_algorithms import finallyRetired
+
+    print("=" * 70)
+    print("HISTORICAL BACKTEST CHECKS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    # A constant history: every start is the same finallyRetired plan, and
+    # starts with less history left than that outlast the data (inf)
+    for expense, target_years in ((9000, 10), (12000, 10)):
+        result = backtest_withdrawal_plan(100000, expense, [0.04] * 60, target_years)
+        exact = finallyRetired(100000, expense, 0.04)
+        remaining_years = 60 - np.arange(len(result["depletion_years"]))
+        check(f"Constant rates, expense {expense}: starts last {exact} years "
+              f"like finallyRetired",
+              np.array_equal(result["depletion_years"],
+                             np.where(remaining_years >= exact, exact, np.inf))
+              and result["success_rate"] == float(exact >= target_years))
+
+    # A crash early in the history only hurts the starts that live through it
+    rates = np.full(60, 0.05)
+    rates[20] = -0.6
+    result = backtest_withdrawal_plan(1000000, 60000, rates, 25)
+    failing = set(result["failing_start_years"].tolist())
+    check(f"Crash in year 20 fails start years {sorted(failing)}",
+          failing and failing <= set(range(21)) and result["worst_start_year"] in failing)
+    check("Starts after the crash are ranked best",
+          result["best_start_year"] > 20 and result["best"] >= result["median"] >= result["worst"])
+
+    # Depletion years match a per-start replay of the recurrence
+    rng = np.random.default_rng(11)
+    rates = rng.normal(0.05, 0.15, 80)
+    result = backtest_withdrawal_plan(1000000, 55000, rates, 30)
+    mismatches = 0
+    for start, depletion in enumerate(result["depletion_years"]):
+        balance, years = 1000000.0, 0
+        for rate in rates[start:]:
+            if balance < 55000:
+                break
+            balance = (balance - 55000) * (1.0 + rate)
+            years += 1
+        else:
+            years = np.inf if balance >= 55000 else years
+        mismatches += depletion != years
+    check(f"Depletion years match a per-start replay ({mismatches} differ)", mismatches == 0)
+
+    print("=" * 70)
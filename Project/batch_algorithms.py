@@ -0,0 +1,629 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Batch (Vectorized) Algorithms
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module evaluates the algorithms in retirement_algorithms.py over whole
+portfolios at once using NumPy arrays:
+- Inputs are validated once for the whole array instead of per element
+- Each scenario is one element (or row) of a broadcast array expression
+- Results are returned as arrays in the broadcast shape of the inputs
+
+Requires NumPy (see requirements.txt).
+"""
+
+import itertools
+
+import numpy as np
+
+
+def fixedInvestor_batch(principals, rates, years):
+    """
+    Vectorized fixedInvestor over arrays of (principal, rate, years).
+
+    Each element follows the same recurrence as fixedInvestor:
+        B(t) = (B(t-1) + principal) × (1 + rate)
+    and is evaluated with the same closed form, so the year count of one
+    scenario does not affect the cost of any other.
+
+    Time Complexity: O(m) where m = number of scenarios (independent of years)
+    Space Complexity: O(m)
+
+    Parameters:
+        principals (array_like): Annual contributions (must be >= 0)
+        rates (array_like): Annual interest rates as decimals (must be >= -1)
+        years (array_like of int): Contribution years (must be >= 0)
+
+    Returns:
+        numpy.ndarray: Final balances in the broadcast shape of the inputs
+
+    Raises:
+        ValueError: If any input is invalid (negative values, rate < -1)
+        TypeError: If years is not an integer array
+
+    Example:
+        >>> fixedInvestor_batch([7500, 1000], 0.05, [3, 10])
+        array([24825.9375    , 13206.78716233])
+    """
+    principals = np.asarray(principals, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    years = np.asarray(years)
+
+    # Input validation (once for the whole batch)
+    if not np.issubdtype(years.dtype, np.integer):
+        raise TypeError(f"Years must be integers, got dtype {years.dtype}")
+    _check_non_negative(principals, "Principal")
+    check_rates(rates)
+    _check_non_negative(years, "Years")
+
+    principals, rates, years = np.broadcast_arrays(principals, rates, years)
+
+    with np.errstate(invalid="ignore"):
+        balances = principals * accumulation_factor_array(rates, years)
+
+    # Zero contributions stay zero even where the factor overflowed to inf
+    return np.where(principals == 0.0, 0.0, balances)
+
+
+def variableInvestor_batch(principals, rate_matrix):
+    """
+    Vectorized variableInvestor over many portfolios and rate paths.
+
+    Each row follows the same recurrence as variableInvestor:
+        B(t) = B(t-1) × (1 + rate_matrix[..., t-1])
+    so the final balance is principal × prod(1 + rates) along the year axis.
+
+    Time Complexity: O(m × n) where m = rows, n = years
+    Space Complexity: O(m × n) for the growth factors
+
+    Parameters:
+        principals (array_like): Initial investments (must be >= 0),
+                                 broadcast against the leading axes of
+                                 rate_matrix
+        rate_matrix (array_like): Annual rates with years on the last axis,
+                                  e.g. shape (m, n) for m portfolios
+
+    Returns:
+        numpy.ndarray: Final balances, shape = broadcast of principals with
+                       rate_matrix.shape[:-1]
+
+    Raises:
+        ValueError: If any principal is negative, any rate < -1, or the
+                    year axis is empty
+
+    Example:
+        >>> variableInvestor_batch([10000, 5000], [[0.05, 0.03, -0.02],
+        ...                                        [0.10, 0.00,  0.10]])
+        array([10598.7, 6050. ])
+    """
+    principals = np.asarray(principals, dtype=float)
+    rate_matrix = np.asarray(rate_matrix, dtype=float)
+
+    # Input validation (once for the whole batch)
+    _check_non_negative(principals, "Principal")
+    if rate_matrix.ndim == 0 or rate_matrix.shape[-1] == 0:
+        raise ValueError("rate_matrix must have at least one year on its last axis")
+    check_rates(rate_matrix)
+
+    growth = np.prod(1.0 + rate_matrix, axis=-1)
+
+    return principals * growth
+
+
+def finallyRetired_batch(balances, expenses, rates, inflation=0.0):
+    """
+    Vectorized finallyRetired over arrays of (balance, expense, rate).
+
+    Each element has the same semantics as finallyRetired:
+        - 0 where balance < expense (cannot afford the first withdrawal)
+        - inf where the plan is a perpetuity, (balance - expense) × rate >= expense
+        - otherwise the closed-form depletion year floor(x) + 1, with the
+          same one-year rounding guard against the closed-form balance
+        - withdrawals growing by inflation are evaluated as flat ones at the
+          real rate (1 + rate) / (1 + inflation) - 1
+
+    Use numpy.isinf on the result to flag perpetuity rows.
+
+    Time Complexity: O(m) where m = number of scenarios
+    Space Complexity: O(m)
+
+    Parameters:
+        balances (array_like): Initial retirement balances (must be >= 0)
+        expenses (array_like): Annual withdrawals (must be >= 0)
+        rates (array_like): Post-retirement interest rates (must be >= -1)
+        inflation (array_like): Yearly growth of the withdrawals
+                                (default: 0.0, must be > -1)
+
+    Returns:
+        numpy.ndarray: Years survived as floats (whole numbers or inf), in
+                       the broadcast shape of the inputs
+
+    Raises:
+        ValueError: If any balance or expense is negative, any rate < -1,
+                    or any inflation <= -1
+
+    Example:
+        >>> finallyRetired_batch([100000, 100000, 500], 10000, [0.03, 0.50, 0.03])
+        array([11., inf,  0.])
+    """
+    balances = np.asarray(balances, dtype=float)
+    expenses = np.asarray(expenses, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+
+    # Input validation (once for the whole batch)
+    _check_non_negative(balances, "Balance")
+    _check_non_negative(expenses, "Expense")
+    check_rates(rates)
+    rates = _real_rates(rates, inflation)
+
+    balances, expenses, rates = np.broadcast_arrays(balances, expenses, rates)
+    years_survived = np.zeros(balances.shape)
+
+    # Edge case: cannot afford even first withdrawal (stays 0)
+    affordable = balances >= expenses
+
+    # Perpetuity: growth on the remainder covers every future withdrawal
+    with np.errstate(invalid="ignore"):
+        perpetuity = affordable & (
+            (expenses == 0.0) | ((balances - expenses) * rates >= expenses)
+        )
+    years_survived[perpetuity] = np.inf
+
+    # Only depleting rows are evaluated from here on
+    depleting = affordable & ~perpetuity
+    years_survived[depleting] = _depletion_year_array(
+        balances[depleting], expenses[depleting], rates[depleting]
+    )
+
+    return years_survived
+
+
+def maximumExpensed_batch(balances, rates, target_years, epsilon=0.01,
+                          max_iterations=100, method="auto", return_method=False,
+                          inflation=0.0):
+    """
+    Vectorized maximumExpensed over arrays of (balance, rate, target_years).
+
+    Solver Paths (per row, as in maximumExpensed):
+        method="auto" (default):
+            Analytic annuity-due answer where it applies (integer target
+            and rate > -100%), vectorized bisection for the other rows.
+        method="analytic":
+            Analytic only; raises ValueError if any row cannot use it.
+        method="bisection":
+            Every row runs the scalar binary search in lockstep: each pass
+            evaluates all unfinished rows with one finallyRetired_batch
+            call, and rows drop out as soon as they converge or hit an
+            exact match. Because finallyRetired_batch matches
+            finallyRetired element for element, each row follows exactly
+            the scalar search and returns the same value.
+
+    Withdrawals growing by inflation are solved at the real rate, as in
+    maximumExpensed, and the result is the first-year withdrawal.
+
+    Time Complexity:
+        Analytic: O(m) where m = number of rows
+        Bisection: O(m × log(balance/epsilon)), with converged rows costing
+                   nothing in later passes
+    Space Complexity: O(m)
+
+    Parameters:
+        balances (array_like): Initial balances (must be > 0)
+        rates (array_like): Growth rates (must be >= -1)
+        target_years (array_like): Desired durations (must be > 0)
+        epsilon (float): Bisection convergence threshold (default: 0.01)
+        max_iterations (int): Bisection safety limit (default: 100)
+        method (str): "auto", "analytic" or "bisection" (default: "auto")
+        return_method (bool): Also return which path answered each row
+        inflation (array_like): Yearly growth of the withdrawals
+                                (default: 0.0, must be > -1)
+
+    Returns:
+        numpy.ndarray: Optimal withdrawals in the broadcast shape of the inputs
+        tuple: (withdrawals, paths) when return_method is True, where paths
+               holds "analytic" or "bisection" per row
+
+    Raises:
+        ValueError: On invalid inputs, an unknown method, or rows that
+                    method="analytic" cannot handle
+
+    Example:
+        >>> maximumExpensed_batch([500000, 1000], [0.04, 0.05], [25, 2.5],
+        ...                       return_method=True)
+        (array([30774.98210887,   349.72000122]), array(['analytic', 'bisection'], dtype='<U9'))
+    """
+    balances = np.asarray(balances, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    target_years = np.asarray(target_years, dtype=float)
+
+    # Input validation (once for the whole batch)
+    if np.any(balances <= 0):
+        index = first_index(balances <= 0)
+        raise ValueError(f"Balance must be positive at index {index}: {balances[index]}")
+    if np.any(target_years <= 0):
+        index = first_index(target_years <= 0)
+        raise ValueError(f"Target years must be positive at index {index}: {target_years[index]}")
+    if epsilon <= 0:
+        raise ValueError(f"Epsilon must be positive: {epsilon}")
+    check_rates(rates)
+    if method not in ("auto", "analytic", "bisection"):
+        raise ValueError(f"Method must be 'auto', 'analytic' or 'bisection': {method}")
+    rates = _real_rates(rates, inflation)
+
+    balances, rates, target_years = np.broadcast_arrays(balances, rates, target_years)
+    withdrawals = np.empty(balances.shape)
+
+    if method == "bisection":
+        analytic = np.zeros(balances.shape, dtype=bool)
+    else:
+        analytic = (rates > -1.0) & (target_years == np.floor(target_years))
+        if method == "analytic" and not analytic.all():
+            index = first_index(~analytic)
+            raise ValueError(
+                f"Analytic solver needs integer target_years and rate > -100% "
+                f"at index {index}: target_years={target_years[index]}, rate={rates[index]}"
+            )
+
+    withdrawals[analytic] = _affordable_expense_array(
+        balances[analytic],
+        balances[analytic] / annuity_due_factor_array(rates[analytic], target_years[analytic]),
+        rates[analytic], target_years[analytic],
+    )
+    withdrawals[~analytic] = _bisect_expense_array(
+        balances[~analytic], rates[~analytic], target_years[~analytic],
+        epsilon, max_iterations,
+    )
+
+    if return_method:
+        return withdrawals, np.where(analytic, "analytic", "bisection")
+    return withdrawals
+
+
+def withdrawal_frontier(balances, rates, max_years):
+    """
+    Maximum sustainable withdrawal for every target from 1 to max_years.
+
+    Evaluates maximumExpensed's analytic answer balance / ä(n) for all n at
+    once, instead of one independent search per target. Passing an array of
+    rates (and/or balances) gives a full rate × duration heatmap.
+
+    Time Complexity: O(m × max_years) where m = number of (balance, rate) pairs
+    Space Complexity: O(m × max_years)
+
+    Parameters:
+        balances (array_like): Initial balances (must be > 0)
+        rates (array_like): Growth rates (must be >= -1); at -100% no
+                            positive withdrawal lasts past year 1, so
+                            longer targets report 0
+        max_years (int): Longest target duration (must be >= 1)
+
+    Returns:
+        numpy.ndarray: Shape broadcast(balances, rates).shape + (max_years,);
+                       entry [..., n - 1] is the largest withdrawal lasting
+                       exactly n years
+
+    Raises:
+        ValueError: If any balance is not positive, any rate < -1, or
+                    max_years < 1
+
+    Example:
+        >>> frontier = withdrawal_frontier(500000, [0.03, 0.04, 0.05], 60)
+        >>> frontier[1, 24]       # == maximumExpensed(500000, 0.04, 25)
+        30774.98210887...
+    """
+    balances = np.asarray(balances, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+
+    # Input validation (once for the whole batch)
+    if np.any(balances <= 0):
+        index = first_index(balances <= 0)
+        raise ValueError(f"Balance must be positive at index {index}: {balances[index]}")
+    check_rates(rates)
+    if max_years < 1:
+        raise ValueError(f"max_years must be at least 1: {max_years}")
+
+    balances, rates = np.broadcast_arrays(balances, rates)
+    target_years = np.arange(1, max_years + 1)
+
+    annuity_factors = annuity_due_factor_array(rates[..., None], target_years)
+
+    with np.errstate(divide="ignore"):
+        withdrawals = balances[..., None] / annuity_factors
+
+    return _affordable_expense_array(balances[..., None], withdrawals, rates[..., None],
+                                     target_years)
+
+
+# ============================================
+# SHARED HELPERS
+# ============================================
+
+def accumulation_factor_array(rates, years):
+    """
+    Array version of retirement_algorithms._accumulation_factor.
+
+    g + g^2 + ... + g^n for g = 1 + rate, evaluated with expm1/log1p so
+    near-zero rates keep full precision. rate == 0 gives n, rate == -1
+    gives 0, and overflow gives inf.
+    """
+    rates = np.asarray(rates, dtype=float)
+    years = np.asarray(years, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        compound_minus_one = np.expm1(years * np.log1p(rates))
+        factor = (1.0 + rates) * compound_minus_one / rates
+
+    factor = np.where(rates == 0.0, years, factor)
+    factor = np.where((rates == -1.0) | (years == 0), 0.0, factor)
+
+    return factor
+
+
+def annuity_due_factor_array(rates, years):
+    """
+    Array version of retirement_algorithms._annuity_due_factor.
+
+    Same split as the scalar version: the discount form for growing rates
+    and g^(1-n) × (1 + A(r, n - 1)) for shrinking rates.
+    """
+    rates, years = np.broadcast_arrays(np.asarray(rates, dtype=float),
+                                       np.asarray(years, dtype=float))
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        discount_form = -np.expm1(-years * np.log1p(rates)) * (1.0 + rates) / rates
+        shrinking_form = ((1.0 + accumulation_factor_array(rates, np.maximum(years - 1, 0)))
+                          / (1.0 + rates) ** (years - 1))
+
+    factor = np.where(rates > 0.0, discount_form, shrinking_form)
+    factor = np.where(rates == 0.0, years, factor)
+    return np.where(years == 0, 0.0, factor)
+
+
+def _affordable_expense_array(balances, expenses, rates, years):
+    """
+    Array version of retirement_algorithms._affordable_expense.
+
+    Steps each analytic withdrawal down, doubling the step, until
+    B(n-1) >= expense, so that finallyRetired reports exactly n years.
+    """
+    balances, expenses, rates, years = (
+        np.array(array, dtype=float)
+        for array in np.broadcast_arrays(balances, expenses, rates, years)
+    )
+    steps = np.spacing(expenses)
+    short = (expenses > 0.0) & (
+        _retirement_balance_array(balances, expenses, rates, years - 1.0) < expenses
+    )
+
+    while np.any(short):
+        expenses[short] = np.maximum(0.0, expenses[short] - steps[short])
+        steps[short] *= 2.0
+        short[short] = (expenses[short] > 0.0) & (
+            _retirement_balance_array(balances[short], expenses[short], rates[short],
+                                      years[short] - 1.0) < expenses[short]
+        )
+
+    return expenses
+
+
+def _retirement_balance_array(balances, expenses, rates, years):
+    """
+    Array version of retirement_algorithms._retirement_balance.
+
+    B(t) = balance × g^t - expense × (g + g^2 + ... + g^t)
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        compound = (1.0 + rates) ** years
+        return balances * compound - expenses * accumulation_factor_array(rates, years)
+
+
+def _depletion_year_array(balances, expenses, rates):
+    """
+    Array version of retirement_algorithms._depletion_year.
+
+    Assumes balance >= expense > 0 and no perpetuities in any row.
+    """
+    surplus_ratios = (balances - expenses) * rates / expenses
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_growth = np.log1p(rates)
+        small_ratio = -np.log1p(-surplus_ratios) / log_growth
+        # Large ratios: split the log to avoid overflowing the quotient
+        large_ratio = (
+            np.log(expenses) - np.log(expenses - (balances - expenses) * rates)
+        ) / log_growth
+
+    boundary = np.where(np.abs(surplus_ratios) < 0.5, small_ratio, large_ratio)
+    boundary = np.where(rates == 0.0, (balances - expenses) / expenses, boundary)
+
+    # Everything left after the first withdrawal is wiped out at -100%
+    boundary = np.where(rates == -1.0, 0.0, boundary)
+
+    years = np.floor(boundary) + 1.0
+
+    # Guard against rounding on either side of an exact boundary year
+    step_back = (years > 1.0) & (
+        _retirement_balance_array(balances, expenses, rates, years - 1.0) < expenses
+    )
+    step_forward = ~step_back & (
+        _retirement_balance_array(balances, expenses, rates, years) >= expenses
+    )
+
+    return years - step_back + step_forward
+
+
+def trajectory_array(trajectory):
+    """
+    Collect a year-by-year trajectory into one array.
+
+    Accepts the generators from retirement_algorithms (iter_fixed_balances,
+    iter_variable_balances, iter_retirement_balances) or any iterable of
+    (year, balance, cash flow, growth) rows, and fills the array directly
+    without building an intermediate list.
+
+    Time Complexity: O(n) where n = number of rows
+    Space Complexity: O(n)
+
+    Returns:
+        numpy.ndarray: Shape (n, 4); columns are year, balance, cash flow
+                       (contribution or withdrawal) and growth
+
+    Example:
+        >>> trajectory_array(iter_fixed_balances(7500, 0.05, 2))
+        array([[1.000000e+00, 7.875000e+03, 7.500000e+03, 3.750000e+02],
+               [2.000000e+00, 1.614375e+04, 7.500000e+03, 7.687500e+02]])
+    """
+    flat = np.fromiter(itertools.chain.from_iterable(trajectory), dtype=float)
+    return flat.reshape(-1, 4)
+
+
+def _bisect_expense_array(balances, rates, target_years, epsilon, max_iterations):
+    """
+    Row-wise retirement_algorithms._bisect_expense on 1-D arrays.
+
+    Only unfinished rows are carried into each pass.
+    """
+    low_expenses = np.zeros(balances.shape)
+    high_expenses = balances.copy()
+    exact_matches = np.full(balances.shape, np.nan)
+
+    # Indices of rows still searching
+    searching = np.flatnonzero(high_expenses - low_expenses > epsilon)
+    iteration_count = 0
+
+    while searching.size and iteration_count < max_iterations:
+        mid_expenses = (low_expenses[searching] + high_expenses[searching]) / 2.0
+        years_lasted = finallyRetired_batch(
+            balances[searching], mid_expenses, rates[searching]
+        )
+        targets = target_years[searching]
+
+        # Funds last too long → can afford higher expense
+        too_low = years_lasted > targets
+        low_expenses[searching[too_low]] = mid_expenses[too_low]
+
+        # Funds deplete too soon → need lower expense
+        too_high = years_lasted < targets
+        high_expenses[searching[too_high]] = mid_expenses[too_high]
+
+        # Exact match found → this row is done
+        exact = ~too_low & ~too_high
+        exact_matches[searching[exact]] = mid_expenses[exact]
+
+        searching = searching[~exact]
+        searching = searching[high_expenses[searching] - low_expenses[searching] > epsilon]
+        iteration_count += 1
+
+    # Other rows: best approximation after convergence or max iterations
+    return np.where(np.isnan(exact_matches),
+                    (low_expenses + high_expenses) / 2.0, exact_matches)
+
+
+def _check_non_negative(values, name):
+    """Raise ValueError naming the first negative entry, if any."""
+    negative = values < 0
+    if np.any(negative):
+        index = first_index(negative)
+        raise ValueError(f"{name} cannot be negative at index {index}: {values[index]}")
+
+
+def check_rates(rates):
+    """Raise ValueError naming the first rate below -100%, if any."""
+    too_low = rates < -1.0
+    if np.any(too_low):
+        index = first_index(too_low)
+        raise ValueError(f"Rate at index {index} cannot be less than -100%: {rates[index]}")
+
+
+def _real_rates(rates, inflation):
+    """
+    Validate inflation and return the real rates (rate - inflation) / (1 + inflation).
+
+    Exactly the nominal rates when inflation == 0, matching
+    retirement_algorithms._real_rate element for element.
+    """
+    inflation = np.asarray(inflation, dtype=float)
+    if np.any(inflation <= -1.0):
+        index = first_index(inflation <= -1.0)
+        raise ValueError(f"Inflation at index {index} must be greater than -100%: {inflation[index]}")
+    return (rates - inflation) / (1.0 + inflation)
+
+
+def first_index(mask):
+    """Index (tuple for n-d, int for 1-d) of the first True entry in mask."""
+    index = tuple(int(i) for i in np.unravel_index(np.argmax(mask), mask.shape))
+    return index[0] if len(index) == 1 else index
+
+
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    from retirement_algorithms import (
+        fixedInvestor,
+        variableInvestor,
+        finallyRetired,
+        maximumExpensed,
+    )
+
+    print("=" * 70)
+    print("BATCH vs SCALAR AGREEMENT")
+    print("=" * 70)
+
+    def report(name, batch, scalar):
+        """Count rows where batch and scalar differ beyond rounding."""
+        batch, scalar = np.asarray(batch, dtype=float), np.asarray(scalar, dtype=float)
+        with np.errstate(invalid="ignore"):
+            difference = np.abs(batch - scalar)
+        equal = (batch == scalar) | (difference <= 1e-9 * np.maximum(np.abs(scalar), 1.0))
+        mismatches = int(np.count_nonzero(~equal))
+        print(f"{name}: {mismatches} of {scalar.size} rows differ "
+              f"{'✓ PASS' if mismatches == 0 else '✗ FAIL'}")
+
+    rng = np.random.default_rng(4)
+    n_rows = 2000
+    balances = rng.uniform(1e3, 1e7, n_rows)
+    rates = rng.uniform(-0.10, 0.20, n_rows)
+    rates[:20] = 0.0                                # exact zero-rate and -100% branches
+    rates[20:30] = -1.0
+    years = rng.integers(0, 80, n_rows)
+    expenses = balances * rng.uniform(0.0, 0.3, n_rows)
+    targets = rng.integers(1, 60, n_rows)
+    rows = range(n_rows)
+
+    report("fixedInvestor_batch", fixedInvestor_batch(balances, rates, years),
+           [fixedInvestor(balances[i], rates[i], int(years[i])) for i in rows])
+
+    rate_matrix = rng.normal(0.05, 0.15, (n_rows, 30))
+    report("variableInvestor_batch", variableInvestor_batch(balances, rate_matrix),
+           [variableInvestor(balances[i], list(rate_matrix[i])) for i in rows])
+
+    # Depletion years must match exactly, perpetuities (inf) included
+    for inflation in (0.0, 0.03):
+        report(f"finallyRetired_batch (inflation={inflation})",
+               finallyRetired_batch(balances, expenses, rates, inflation=inflation),
+               [finallyRetired(balances[i], expenses[i], rates[i], inflation=inflation)
+                for i in rows])
+
+    for method, target_years in (("auto", targets), ("bisection", targets + 0.5)):
+        report(f"maximumExpensed_batch (method={method})",
+               maximumExpensed_batch(balances, rates, target_years, method=method),
+               [maximumExpensed(balances[i], rates[i], target_years[i], method=method)
+                for i in rows])
+
+    # At -100% the frontier reports 0 past year 1 while maximumExpensed
+    # bisects to within epsilon of it, so compare the analytic rows only
+    frontier_rows = np.flatnonzero(rates > -1.0)[:200]
+    report("withdrawal_frontier",
+           withdrawal_frontier(balances[frontier_rows], rates[frontier_rows], 40),
+           [[maximumExpensed(balances[i], rates[i], n) for n in range(1, 41)]
+            for i in frontier_rows])
+
+    print("=" * 70)
@@ -0,0 +1,410 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Compounding Frequency
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module runs the four core algorithms with interest credited more
+often than once a year:
+- Frequencies: "annual" (1 period/year), "monthly" (12), "daily" (365)
+  and "continuous"
+- Rates are nominal annual rates: each period earns rate / periods, and
+  continuous compounding grows by e^(rate × t)
+- Contributions and expenses are annual amounts spread evenly over the
+  periods (amount / periods each period, or a continuous stream)
+- Timing: "start" of each period (annuity-due, as in the core algorithms)
+  or "end" of each period (ordinary annuity)
+
+Every period has the same affine map, so n periods collapse into the
+geometric-series closed forms of retirement_algorithms.py evaluated with
+the per-period rate: finer granularity costs O(1), not O(n). Each function
+keeps method="iterative" (one loop step per period) as the reference.
+"""
+
+import math
+
+from retirement_algorithms import (
+    finallyRetired,
+    accumulation_factor,
+    affordable_expense,
+    annuity_due_factor,
+)
+
+
+PERIODS_PER_YEAR = {"annual": 1, "monthly": 12, "daily": 365}
+FREQUENCIES = tuple(PERIODS_PER_YEAR) + ("continuous",)
+TIMINGS = ("start", "end")
+
+
+def fixedInvestor_compounded(principal, rate, years, frequency="monthly",
+                             timing="start", method="closed"):
+    """
+    fixedInvestor with contributions and interest every period.
+
+    Recurrence (per period, c = principal / m, i = rate / m, m periods/year):
+        timing="start":  B(k) = (B(k-1) + c) × (1 + i)
+        timing="end":    B(k) = B(k-1) × (1 + i) + c
+
+    Closed Form (n = years × m periods, g = 1 + i):
+        start:  B(n) = c × (g + g^2 + ... + g^n)
+        end:    B(n) = c × (1 + g + ... + g^(n-1))
+        continuous:  B(T) = principal × (e^(rate × T) - 1) / rate
+
+    frequency="annual", timing="start" is exactly fixedInvestor.
+
+    Time Complexity: O(1) closed form, O(n) iterative where n = periods
+    Space Complexity: O(1)
+
+    Parameters:
+        principal (float): Annual contribution amount (must be >= 0)
+        rate (float): Nominal annual interest rate (must be >= -1)
+        years (int): Number of contribution years (must be >= 0)
+        frequency (str): "annual", "monthly", "daily" or "continuous"
+        timing (str): "start" or "end" of each period (ignored when continuous)
+        method (str): "closed" or "iterative" (default: "closed")
+
+    Returns:
+        float: Total accumulated balance
+
+    Raises:
+        ValueError: If inputs are invalid, or method="iterative" is
+                    requested for continuous compounding
+        TypeError: If years is not an integer
+
+    Example:
+        >>> fixedInvestor_compounded(7500, 0.05, 3)               # monthly
+        24321.75
+        >>> fixedInvestor_compounded(7500, 0.05, 3, "annual")     # == fixedInvestor
+        24825.9375
+    """
+    # Input validation
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+    if rate < -1.0:
+        raise ValueError(f"Rate cannot be less than -100%: {rate}")
+    if years < 0:
+        raise ValueError(f"Years cannot be negative: {years}")
+    if not isinstance(years, int):
+        raise TypeError(f"Years must be an integer: {years}")
+    periods_per_year = _periods_per_year(frequency)
+    _check_timing_and_method(timing, method, periods_per_year)
+
+    if years == 0 or principal == 0:
+        return 0.0
+
+    if periods_per_year is None:
+        return principal * _continuous_accumulation_factor(rate, years)
+
+    contribution = principal / periods_per_year
+    period_rate = rate / periods_per_year
+    periods = years * periods_per_year
+
+    if method == "closed":
+        if timing == "start":
+            return contribution * accumulation_factor(period_rate, periods)
+        return contribution * (1.0 + accumulation_factor(period_rate, periods - 1))
+
+    current_balance = 0.0
+    growth_multiplier = 1.0 + period_rate
+    for period in range(periods):
+        if timing == "start":
+            current_balance = (current_balance + contribution) * growth_multiplier
+        else:
+            current_balance = current_balance * growth_multiplier + contribution
+
+    return current_balance
+
+
+def variableInvestor_compounded(principal, rateList, frequency="monthly"):
+    """
+    variableInvestor with each year's rate compounded every period.
+
+    Year t grows by (1 + r_t / m)^m, or e^(r_t) when continuous, so the
+    cost is O(1) per year whatever the frequency.
+
+    Time Complexity: O(n) where n = len(rateList)
+    Space Complexity: O(1)
+
+    Parameters:
+        principal (float): Initial investment amount (must be >= 0)
+        rateList (list of float): Nominal annual rates (each >= -1)
+        frequency (str): "annual", "monthly", "daily" or "continuous"
+
+    Returns:
+        float: Final accumulated balance
+
+    Raises:
+        ValueError: If principal is negative, rateList is empty or contains
+                    a rate < -1, or frequency is unknown
+        TypeError: If rateList is not a list or contains non-numeric values
+
+    Example:
+        >>> variableInvestor_compounded(10000, [0.05, 0.03, -0.02])
+        10616.69
+    """
+    # Input validation
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+    if not isinstance(rateList, list):
+        raise TypeError(f"rateList must be a list, got {type(rateList)}")
+    if len(rateList) == 0:
+        raise ValueError("rateList cannot be empty")
+    periods_per_year = _periods_per_year(frequency)
+
+    for i, rate in enumerate(rateList):
+        if not isinstance(rate, (int, float)):
+            raise TypeError(f"Rate at index {i} must be numeric: {rate}")
+        if rate < -1.0:
+            raise ValueError(f"Rate at index {i} cannot be less than -100%: {rate}")
+
+    current_balance = principal
+    for rate in rateList:
+        if periods_per_year is None:
+            current_balance *= math.exp(rate)
+        else:
+            current_balance *= (1.0 + rate / periods_per_year) ** periods_per_year
+
+    return current_balance
+
+
+def finallyRetired_compounded(balance, expense, rate, frequency="monthly",
+                              timing="start", method="closed"):
+    """
+    finallyRetired with withdrawals and interest every period.
+
+    Recurrence (per period, e = expense / m, i = rate / m, g = 1 + i):
+        timing="start":  B(k) = (B(k-1) - e) × g     while B(k-1) >= e
+        timing="end":    B(k) = B(k-1) × g - e       while B(k-1) × g >= e
+
+    Substituting B' = B × g turns the end-of-period recurrence into the
+    start-of-period one on a fund of balance × g, so both timings reuse
+    finallyRetired's closed form with per-period inputs.
+
+    Continuous (withdrawal stream of expense per year):
+        dB/dt = rate × B - expense, which reaches zero at
+        T = -log(1 - rate × balance / expense) / rate   (balance / expense
+        when rate == 0); it never does when rate × balance >= expense.
+
+    Time Complexity: O(1) closed form, O(n) iterative where n = periods
+    Space Complexity: O(1)
+
+    Parameters:
+        balance (float): Initial retirement account value (must be >= 0)
+        expense (float): Annual withdrawal amount (must be >= 0)
+        rate (float): Nominal annual interest rate (must be >= -1)
+        frequency (str): "annual", "monthly", "daily" or "continuous"
+        timing (str): "start" or "end" of each period (ignored when continuous)
+        method (str): "closed" or "iterative" (default: "closed")
+
+    Returns:
+        float: Years of withdrawals (periods survived / m, so fractional for
+               monthly and daily; real-valued when continuous)
+               math.inf if the plan never depletes
+
+    Raises:
+        ValueError: If inputs are invalid, or method="iterative" is
+                    requested for continuous compounding
+
+    Example:
+        >>> finallyRetired_compounded(100000, 10000, 0.03)
+        11.833333333333334    # 142 monthly withdrawals of $833.33
+    """
+    # Input validation
+    if balance < 0:
+        raise ValueError(f"Balance cannot be negative: {balance}")
+    if expense < 0:
+        raise ValueError(f"Expense cannot be negative: {expense}")
+    if rate < -1.0:
+        raise ValueError(f"Rate cannot be less than -100%: {rate}")
+    periods_per_year = _periods_per_year(frequency)
+    _check_timing_and_method(timing, method, periods_per_year)
+
+    if periods_per_year is None:
+        return _continuous_depletion_time(balance, expense, rate)
+
+    period_expense = expense / periods_per_year
+    period_rate = rate / periods_per_year
+    if timing == "end":
+        balance = balance * (1.0 + period_rate)
+
+    periods = finallyRetired(balance, period_expense, period_rate, method)
+    return periods / periods_per_year
+
+
+def maximumExpensed_compounded(balance, rate, target_years=20, frequency="monthly",
+                               timing="start"):
+    """
+    maximumExpensed with withdrawals and interest every period.
+
+    Analytic Solution (n = target_years × m periods, i = rate / m):
+        timing="start":  e* = balance / ä(n)
+        timing="end":    e* = balance × (1 + i) / ä(n)
+        annual expense = e* × m
+    where ä(n) is the annuity-due factor at the per-period rate, and
+        continuous:      expense* = balance × rate / (1 - e^(-rate × T))
+                         (balance / T when rate == 0)
+
+    Feeding the result back into finallyRetired_compounded returns
+    target_years.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+
+    Parameters:
+        balance (float): Initial retirement fund balance (must be > 0)
+        rate (float): Nominal annual interest rate (must be >= -1)
+        target_years (float): Desired duration (must be > 0 and a whole
+                              number of periods unless continuous)
+        frequency (str): "annual", "monthly", "daily" or "continuous"
+        timing (str): "start" or "end" of each period (ignored when continuous)
+
+    Returns:
+        float: Maximum sustainable annual withdrawal
+
+    Raises:
+        ValueError: If inputs are invalid, target_years is not a whole
+                    number of periods, or rate is -100% with annual periods
+
+    Example:
+        >>> maximumExpensed_compounded(500000, 0.04, target_years=25)
+        31564.99
+    """
+    # Input validation
+    if balance <= 0:
+        raise ValueError(f"Balance must be positive: {balance}")
+    if target_years <= 0:
+        raise ValueError(f"Target years must be positive: {target_years}")
+    if rate < -1.0:
+        raise ValueError(f"Rate cannot be less than -100%: {rate}")
+    periods_per_year = _periods_per_year(frequency)
+    _check_timing_and_method(timing, "closed", periods_per_year)
+
+    if periods_per_year is None:
+        if rate == 0.0:
+            return balance / target_years
+        return balance * rate / -math.expm1(-rate * target_years)
+
+    periods = target_years * periods_per_year
+    if not float(periods).is_integer():
+        raise ValueError(
+            f"Target years must be a whole number of {frequency} periods: {target_years}"
+        )
+    period_rate = rate / periods_per_year
+    if period_rate == -1.0:
+        raise ValueError(f"Rate must be greater than -100% for annual periods: {rate}")
+
+    # End-of-period withdrawals from balance are start-of-period ones from balance × g
+    if timing == "end":
+        balance = balance * (1.0 + period_rate)
+    periods = int(periods)
+    period_expense = affordable_expense(
+        balance, balance / annuity_due_factor(period_rate, periods), period_rate, periods
+    )
+
+    # Keep the annual figure on the affordable side once it is split back into periods
+    annual_expense = period_expense * periods_per_year
+    while annual_expense / periods_per_year > period_expense:
+        annual_expense = math.nextafter(annual_expense, 0.0)
+    return annual_expense
+
+
+# ============================================
+# HELPERS
+# ============================================
+
+def _periods_per_year(frequency):
+    """Periods per year for a frequency name; None for continuous."""
+    if frequency == "continuous":
+        return None
+    if frequency not in PERIODS_PER_YEAR:
+        raise ValueError(f"Frequency must be one of {', '.join(FREQUENCIES)}: {frequency}")
+    return PERIODS_PER_YEAR[frequency]
+
+
+def _check_timing_and_method(timing, method, periods_per_year):
+    """Validate the timing and method options shared by the functions above."""
+    if timing not in TIMINGS:
+        raise ValueError(f"Timing must be 'start' or 'end': {timing}")
+    if method not in ("closed", "iterative"):
+        raise ValueError(f"Method must be 'closed' or 'iterative': {method}")
+    if method == "iterative" and periods_per_year is None:
+        raise ValueError("Continuous compounding has no iterative form; use method='closed'")
+
+
+def _continuous_accumulation_factor(rate, years):
+    """
+    Value of a continuous contribution stream of 1 per year for `years`.
+
+    (e^(rate × T) - 1) / rate, or T when rate == 0.
+    """
+    if rate == 0.0:
+        return float(years)
+    try:
+        return math.expm1(rate * years) / rate
+    except OverflowError:
+        return math.inf
+
+
+def _continuous_depletion_time(balance, expense, rate):
+    """
+    Time at which a continuously withdrawn, continuously compounded fund
+    reaches zero (math.inf if it never does).
+    """
+    if expense == 0 or rate * balance >= expense:
+        return math.inf
+    if rate == 0.0:
+        return balance / expense
+    return -math.log1p(-rate * balance / expense) / rate
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    from retirement_algorithms import fixedInvestor, maximumExpensed, variableInvestor
+
+    print("=" * 70)
+    print("COMPOUNDING FREQUENCY CHECKS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    # Annual, start-of-period compounding is exactly the core algorithms
+    check("annual fixedInvestor_compounded == fixedInvestor",
+          fixedInvestor_compounded(7500, 0.05, 30, frequency="annual")
+          == fixedInvestor(7500, 0.05, 30))
+    check("annual variableInvestor_compounded == variableInvestor",
+          math.isclose(variableInvestor_compounded(10000, [0.05, 0.03, -0.02], "annual"),
+                       variableInvestor(10000, [0.05, 0.03, -0.02]), rel_tol=1e-15))
+    check("annual finallyRetired_compounded == finallyRetired",
+          finallyRetired_compounded(500000, 40000, 0.05, frequency="annual")
+          == finallyRetired(500000, 40000, 0.05))
+    check("annual maximumExpensed_compounded == maximumExpensed",
+          math.isclose(maximumExpensed_compounded(500000, 0.04, 25, frequency="annual"),
+                       maximumExpensed(500000, 0.04, 25), rel_tol=1e-12))
+
+    # Closed forms agree with the period-by-period reference loops
+    for frequency in PERIODS_PER_YEAR:
+        for timing in TIMINGS:
+            closed = fixedInvestor_compounded(7500, 0.05, 30, frequency, timing)
+            iterative = fixedInvestor_compounded(7500, 0.05, 30, frequency, timing,
+                                                 method="iterative")
+            years = finallyRetired_compounded(500000, 40000, 0.05, frequency, timing)
+            check(f"{frequency}/{timing}: closed == iterative",
+                  math.isclose(closed, iterative, rel_tol=1e-9)
+                  and years == finallyRetired_compounded(500000, 40000, 0.05, frequency,
+                                                         timing, method="iterative"))
+
+    # Feeding maximumExpensed_compounded back in lasts exactly the target
+    for frequency in FREQUENCIES:
+        for timing in TIMINGS:
+            expense = maximumExpensed_compounded(500000, 0.04, 25, frequency, timing)
+            check(f"{frequency}/{timing}: maximum expense {expense:,.2f} lasts 25 years",
+                  finallyRetired_compounded(500000, expense, 0.04, frequency, timing) == 25)
+
+    print("=" * 70)
@@ -0,0 +1,489 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Background Job Queue
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module runs long computations (Monte Carlo runs, withdrawal
+frontiers, large maximumExpensed batches) off the web request thread:
+- submit() splits a job into independent tasks and returns a job id
+- Tasks run on one bounded ProcessPoolExecutor shared by all jobs
+- Progress is the fraction of a job's tasks that have finished
+- Task results are folded into one partial result as they finish
+- Batch jobs are split into at most MAX_TASKS chunks (Monte Carlo runs
+  into at most parallel_monte_carlo.MAX_SHARDS shards)
+- Pending tasks of a cancelled job are dropped from the pool
+- At most max_active_jobs jobs are queued or running at once
+- Finished jobs are evicted result_ttl seconds after they finish
+
+Job state lives in memory in the serving process; no broker is needed.
+
+Design Pattern: Divide-and-Conquer (split into tasks, run, combine)
+
+Requires NumPy (see requirements.txt).
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from batch_algorithms import (
+    maximumExpensed_batch,
+    withdrawal_frontier,
+    check_rates,
+    first_index,
+)
+from monte_carlo import DEFAULT_PERCENTILES
+from parallel_monte_carlo import (
+    DEFAULT_SHARD_SIZE,
+    finish_summary,
+    fold_summary,
+    plan_shards,
+    run_shard,
+)
+
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_ACTIVE_JOBS = 16
+DEFAULT_RESULT_TTL = 3600.0
+DEFAULT_CHUNK_SIZE = 50_000
+MAX_TASKS = 10_000
+
+JOB_STATES = ("queued", "running", "succeeded", "failed", "cancelled")
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by submit() when max_active_jobs jobs are already queued or running."""
+
+
+class UnknownJob(KeyError):
+    """Raised for a job id that was never issued or has been evicted."""
+
+
+class JobQueue:
+    """
+    Bounded worker pool with job ids, progress, cancellation and result TTL.
+
+    Example:
+        >>> queue = JobQueue(max_workers=4)
+        >>> job_id = queue.submit("monte_carlo", {"principal": 10000,
+        ...                                       "n_paths": 1000000, "n_years": 30})
+        >>> queue.status(job_id)["progress"]
+        0.4
+        >>> queue.result(job_id)["result"]["success_rate"]
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS,
+                 max_active_jobs=DEFAULT_MAX_ACTIVE_JOBS,
+                 result_ttl=DEFAULT_RESULT_TTL, use_processes=True):
+        """
+        Parameters:
+            max_workers (int): Worker processes (the concurrency limit)
+            max_active_jobs (int): Queued + running jobs accepted at once
+            result_ttl (float): Seconds a finished job is kept
+            use_processes (bool): False runs tasks on threads instead
+                                  (for debugging; no parallel speed-up)
+
+        Raises:
+            ValueError: If any limit is not positive
+        """
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive: {max_workers}")
+        if max_active_jobs <= 0:
+            raise ValueError(f"max_active_jobs must be positive: {max_active_jobs}")
+        if result_ttl <= 0:
+            raise ValueError(f"result_ttl must be positive: {result_ttl}")
+
+        self.max_workers = max_workers
+        self.max_active_jobs = max_active_jobs
+        self.result_ttl = result_ttl
+        self._use_processes = use_processes
+        self._executor = None
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind, params):
+        """
+        Validate and plan a job, queue its tasks and return its id.
+
+        Raises:
+            ValueError: If the kind is unknown or params are invalid
+            JobQueueFull: If max_active_jobs jobs are already active
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(JOB_KINDS)}: {kind}")
+        if not isinstance(params, dict):
+            raise ValueError("params must be an object")
+
+        # Planning validates params and splits the work, before anything is queued
+        tasks, fold, finish = JOB_KINDS[kind](**params)
+
+        with self._lock:
+            self._evict_expired()
+            active = sum(1 for job in self._jobs.values() if job["finished_at"] is None)
+            if active >= self.max_active_jobs:
+                raise JobQueueFull(
+                    f"{active} jobs are already queued or running (limit {self.max_active_jobs})"
+                )
+            if self._executor is None:
+                executor_class = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
+                self._executor = executor_class(max_workers=self.max_workers)
+
+            job_id = uuid.uuid4().hex
+            job = {
+                "id": job_id,
+                "kind": kind,
+                "state": "queued",
+                "created_at": time.time(),
+                "finished_at": None,
+                "n_tasks": len(tasks),
+                "partial": None,
+                "n_done": 0,
+                "fold": fold,
+                "finish": finish,
+                "result": None,
+                "error": None,
+                "futures": [],
+            }
+            self._jobs[job_id] = job
+
+            for function, args in tasks:
+                future = self._executor.submit(function, *args)
+                job["futures"].append(future)
+
+        # Callbacks may run immediately for finished futures, so attach
+        # them after the job is fully registered and the lock is released
+        for index, future in enumerate(job["futures"]):
+            future.add_done_callback(
+                lambda future, index=index: self._task_done(job_id, index, future)
+            )
+
+        return job_id
+
+    def status(self, job_id):
+        """
+        Public view of a job: id, kind, state, progress, timestamps, error.
+
+        Raises:
+            UnknownJob: If the job id is unknown or has been evicted
+        """
+        with self._lock:
+            self._evict_expired()
+            job = self._get(job_id)
+            if job["state"] == "queued" and any(
+                future.running() or future.done() for future in job["futures"]
+            ):
+                job["state"] = "running"
+            return {
+                "id": job["id"],
+                "kind": job["kind"],
+                "state": job["state"],
+                "progress": job["n_done"] / job["n_tasks"],
+                "created_at": job["created_at"],
+                "finished_at": job["finished_at"],
+                "error": job["error"],
+            }
+
+    def result(self, job_id):
+        """status(job_id) plus "result" (None until the job has succeeded)."""
+        status = self.status(job_id)
+        with self._lock:
+            status["result"] = self._get(job_id)["result"]
+        return status
+
+    def cancel(self, job_id):
+        """
+        Cancel a job. Tasks not yet started are dropped; tasks already
+        running finish in their worker but their results are discarded.
+
+        Returns:
+            bool: True if the job was cancelled, False if it had already
+                  finished
+
+        Raises:
+            UnknownJob: If the job id is unknown or has been evicted
+        """
+        with self._lock:
+            job = self._get(job_id)
+            if job["finished_at"] is not None:
+                return False
+            futures = self._finish(job, "cancelled")
+
+        for future in futures:
+            future.cancel()
+        return True
+
+    def shutdown(self):
+        """Cancel pending tasks and stop the worker pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get(self, job_id):
+        """The job record for job_id (lock held)."""
+        if job_id not in self._jobs:
+            raise UnknownJob(job_id)
+        return self._jobs[job_id]
+
+    def _task_done(self, job_id, index, future):
+        """Fold one finished task into the job; finish it when it was the last."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["finished_at"] is not None or future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                futures = self._finish(job, "failed", error=f"{type(error).__name__}: {error}")
+            else:
+                # Folding is cheap (a bin-wise add or a dict insert), so it
+                # runs under the lock and each task result is dropped at once
+                try:
+                    job["partial"] = job["fold"](job["partial"], index, future.result())
+                except Exception as fold_error:
+                    error = f"{type(fold_error).__name__}: {fold_error}"
+                    futures = self._finish(job, "failed", error=error)
+                else:
+                    job["n_done"] += 1
+                    if job["n_done"] < job["n_tasks"]:
+                        return
+                    futures = []
+                    partial, finish = job["partial"], job["finish"]
+
+        if error is not None:
+            for other in futures:
+                other.cancel()
+            return
+
+        # Finish outside the lock; it may touch large arrays
+        try:
+            result, error = finish(partial), None
+        except Exception as finish_error:
+            result, error = None, f"{type(finish_error).__name__}: {finish_error}"
+
+        with self._lock:
+            if job["finished_at"] is None:
+                if error is None:
+                    job["result"] = result
+                    self._finish(job, "succeeded")
+                else:
+                    self._finish(job, "failed", error=error)
+
+    def _finish(self, job, state, error=None):
+        """
+        Mark a job finished and release its task bookkeeping (lock held).
+
+        Returns the job's futures so the caller can cancel leftovers
+        after releasing the lock.
+        """
+        futures = job["futures"]
+        job["state"] = state
+        job["error"] = error
+        job["finished_at"] = time.time()
+        job["partial"] = None
+        job["fold"] = None
+        job["finish"] = None
+        job["futures"] = []
+        return futures
+
+    def _evict_expired(self):
+        """Drop finished jobs older than result_ttl (lock held)."""
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["finished_at"] is not None and job["finished_at"] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# ============================================
+# JOB KINDS
+# ============================================
+# Each planner validates its parameters and returns (tasks, fold, finish):
+# tasks is a list of (module-level function, args) pairs that can be
+# pickled to a worker process. Task results arrive in completion order;
+# fold(partial, index, result) merges one into the partial result (None
+# before the first) and finish(partial) builds the job result.
+
+def plan_monte_carlo(principal, n_paths, n_years, expense=0.0, distribution="normal",
+                     mean=0.05, volatility=0.15, history=None,
+                     percentiles=DEFAULT_PERCENTILES, seed=None,
+                     shard_size=DEFAULT_SHARD_SIZE):
+    """
+    run_parallel_monte_carlo with one task per shard.
+
+    Shards are folded in completion order, so mean_terminal_balance may
+    differ from run_parallel_monte_carlo in the last bits.
+    """
+    shard_args, edges, percentiles = plan_shards(
+        principal, n_paths, n_years, expense, distribution, mean, volatility,
+        history, percentiles, seed, shard_size,
+    )
+    tasks = [(run_shard, args) for args in shard_args]
+    return (
+        tasks,
+        lambda total, index, summary: fold_summary(total, summary),
+        lambda total: finish_summary(total, edges, percentiles),
+    )
+
+
+def plan_maximum_expensed_batch(balances, rates, target_years=20, inflation=0.0,
+                                chunk_size=DEFAULT_CHUNK_SIZE):
+    """maximumExpensed_batch with one task per chunk_size scenarios."""
+    columns, shape = _flatten_broadcast(balances, rates, target_years, inflation)
+
+    # The same checks as maximumExpensed_batch, so bad input fails at submit time
+    _check_positive(columns[0], "Balance")
+    check_rates(columns[1])
+    _check_positive(columns[2], "Target years")
+    if np.any(columns[3] <= -1.0):
+        index = first_index(columns[3] <= -1.0)
+        raise ValueError(
+            f"Inflation at index {index} must be greater than -100%: {columns[3][index]}"
+        )
+    tasks = [
+        (_maximum_expensed_chunk, tuple(column[start:start + chunk_size] for column in columns))
+        for start in range(0, columns[0].size, _check_chunk_size(chunk_size, columns[0].size))
+    ]
+    return tasks, _fold_chunk, lambda chunks: _concatenate_chunks(chunks, shape)
+
+
+def plan_withdrawal_frontier(balances, rates, max_years, chunk_size=DEFAULT_CHUNK_SIZE):
+    """withdrawal_frontier with one task per chunk_size (balance, rate) pairs."""
+    if max_years < 1:
+        raise ValueError(f"max_years must be at least 1: {max_years}")
+    columns, shape = _flatten_broadcast(balances, rates)
+
+    # The same checks as withdrawal_frontier, so bad input fails at submit time
+    _check_positive(columns[0], "Balance")
+    check_rates(columns[1])
+    tasks = [
+        (withdrawal_frontier, tuple(column[start:start + chunk_size] for column in columns)
+         + (max_years,))
+        for start in range(0, columns[0].size, _check_chunk_size(chunk_size, columns[0].size))
+    ]
+    return tasks, _fold_chunk, lambda chunks: _concatenate_chunks(chunks, shape + (max_years,))
+
+
+JOB_KINDS = {
+    "monte_carlo": plan_monte_carlo,
+    "maximum_expensed_batch": plan_maximum_expensed_batch,
+    "withdrawal_frontier": plan_withdrawal_frontier,
+}
+
+
+def _maximum_expensed_chunk(balances, rates, target_years, inflation):
+    """One task of plan_maximum_expensed_batch (module-level so it pickles)."""
+    return maximumExpensed_batch(balances, rates, target_years, inflation=inflation)
+
+
+def _fold_chunk(chunks, index, chunk):
+    """Collect chunk results by task index (they arrive in completion order)."""
+    if chunks is None:
+        chunks = {}
+    chunks[index] = chunk
+    return chunks
+
+
+def _concatenate_chunks(chunks, shape):
+    """Join chunk results in task order and restore the broadcast shape."""
+    return np.concatenate([chunks[index] for index in range(len(chunks))]).reshape(shape)
+
+
+def _flatten_broadcast(*arrays):
+    """Broadcast the inputs together and flatten them into 1-D columns."""
+    try:
+        columns = np.broadcast_arrays(*(np.asarray(array, dtype=float) for array in arrays))
+    except ValueError as error:
+        raise ValueError(f"Inputs cannot be broadcast together: {error}")
+    if columns[0].size == 0:
+        raise ValueError("Inputs cannot be empty")
+    return [column.ravel() for column in columns], columns[0].shape
+
+
+def _check_positive(values, name):
+    """Raise ValueError naming the first entry that is not positive, if any."""
+    not_positive = ~(values > 0)
+    if np.any(not_positive):
+        index = first_index(not_positive)
+        raise ValueError(f"{name} must be positive at index {index}: {values[index]}")
+
+
+def _check_chunk_size(chunk_size, n_scenarios):
+    """
+    Return chunk_size, raising ValueError unless it is positive and splits
+    n_scenarios into at most MAX_TASKS chunks.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive: {chunk_size}")
+    n_chunks = -(-n_scenarios // chunk_size)
+    if n_chunks > MAX_TASKS:
+        raise ValueError(
+            f"{n_chunks} chunks exceeds the limit of {MAX_TASKS}; "
+            f"use a chunk_size of at least {-(-n_scenarios // MAX_TASKS)}"
+        )
+    return chunk_size
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    from parallel_monte_carlo import run_parallel_monte_carlo
+
+    print("=" * 70)
+    print("JOB QUEUE CHECKS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    def wait(queue, job_id):
+        """Poll until the job has finished; return its result record."""
+        while queue.status(job_id)["finished_at"] is None:
+            time.sleep(0.05)
+        return queue.result(job_id)
+
+    queue = JobQueue(max_workers=2, max_active_jobs=3)
+
+    # Job results equal the direct functions, whatever the task order
+    params = {"principal": 1e6, "n_paths": 50_000, "n_years": 30, "expense": 60000,
+              "seed": 3, "shard_size": 5_000}
+    direct = run_parallel_monte_carlo(**params, max_workers=1)
+    result = wait(queue, queue.submit("monte_carlo", params))["result"]
+    check("monte_carlo job == run_parallel_monte_carlo",
+          result["terminal_percentiles"] == direct["terminal_percentiles"]
+          and result["success_rate"] == direct["success_rate"] and result["n_shards"] == 10)
+
+    balances, rates = np.linspace(1e5, 1e6, 1000), np.linspace(-0.05, 0.10, 1000)
+    result = wait(queue, queue.submit("maximum_expensed_batch", {
+        "balances": balances, "rates": rates, "target_years": 25, "chunk_size": 7}))["result"]
+    check("maximum_expensed_batch job == maximumExpensed_batch",
+          np.array_equal(result, maximumExpensed_batch(balances, rates, 25)))
+
+    # Bad params fail at submit time, before anything is queued
+    for kind, bad_params in (("monte_carlo", dict(params, shard_size=1)),
+                             ("maximum_expensed_batch", {"balances": balances, "rates": rates,
+                                                         "chunk_size": 0})):
+        try:
+            queue.submit(kind, bad_params)
+            rejected = False
+        except ValueError:
+            rejected = True
+        check(f"{kind} with bad params is rejected at submit", rejected)
+
+    # Cancelled jobs drop their pending tasks
+    job_id = queue.submit("monte_carlo", dict(params, n_paths=2_000_000, shard_size=10_000))
+    check("cancel() stops a running job",
+          queue.cancel(job_id) and queue.status(job_id)["state"] == "cancelled")
+
+    queue.shutdown()
+    print("=" * 70)
@@ -14,12 +14,14 @@ This is the main user interface that integrates all retirement simulation algori
 Provides a menu-driven CLI with input validation and formatted output.
 """
 
+import math
 import sys
 from retirement_algorithms import (
     fixedInvestor,
     variableInvestor,
     finallyRetired,
     maximumExpensed,
+    iter_variable_balances,
     format_currency,
     format_percentage
 )
@@ -430,11 +432,9 @@ def scenario_variable_investor():
         print(Colors.TITLE + "\n📈 YEAR-BY-YEAR BREAKDOWN:" + Colors.RESET)
         print_divider("─", 60, Colors.GOLD)
         
-        balance = principal
-        print(f"  Year 0:  {format_currency(balance):>15}  (Initial)")
+        print(f"  Year 0:  {format_currency(principal):>15}  (Initial)")
         
-        for year, rate in enumerate(rates, 1):
-            balance = balance * (1 + rate)
+        for (year, balance, _, _), rate in zip(iter_variable_balances(principal, rates), rates):
             print(f"  Year {year}:  {format_currency(balance):>15}  "
                   f"(Rate: {format_percentage(rate)})")
         
@@ -493,7 +493,13 @@ def scenario_retirement_depletion():
         years_lasted = finallyRetired(balance, expense, rate)
         
         # Calculate metrics
-        total_withdrawn = expense * years_lasted
+        is_perpetuity = years_lasted == math.inf
+        if is_perpetuity:
+            total_withdrawn_text = "Unlimited (perpetuity)"
+            duration_text = "Never depletes"
+        else:
+            total_withdrawn_text = format_currency(expense * years_lasted)
+            duration_text = f"{years_lasted} years"
         
         # Display results
         results = [
@@ -501,9 +507,9 @@ def scenario_retirement_depletion():
             f"Annual Withdrawal:       {format_currency(expense)}",
             f"Expected Return Rate:    {format_percentage(rate)}",
             "",
-            f"Total Amount Withdrawn:  {format_currency(total_withdrawn)}",
+            f"Total Amount Withdrawn:  {total_withdrawn_text}",
             "",
-            f"{Colors.GOLD}RETIREMENT DURATION:     {years_lasted} years{Colors.RESET}",
+            f"{Colors.GOLD}RETIREMENT DURATION:     {duration_text}{Colors.RESET}",
         ]
         
         print_result_box("RETIREMENT FUND DEPLETION RESULTS", results)
@@ -512,7 +518,9 @@ def scenario_retirement_depletion():
         print(Colors.TITLE + "\n💡 INTERPRETATION:" + Colors.RESET)
         print_divider("─", 60, Colors.GOLD)
         
-        if years_lasted == 0:
+        if is_perpetuity:
+            print(Colors.GREEN + "  ✓ Growth covers every withdrawal - funds never deplete!" + Colors.RESET)
+        elif years_lasted == 0:
             print(Colors.RED + "  ⚠ WARNING: Insufficient funds for even one withdrawal!" + Colors.RESET)
         elif years_lasted < 10:
             print(Colors.RED + f"  ⚠ Funds will only last {years_lasted} years - consider reducing expenses." + Colors.RESET)
@@ -574,7 +582,13 @@ def scenario_optimal_withdrawal():
         print_info("Running binary search optimization...")
         print_info("This may take a moment for large search spaces...")
         
-        optimal_expense = maximumExpensed(balance, rate, target_years)
+        optimal_expense, solver_path = maximumExpensed(
+            balance, rate, target_years, return_method=True
+        )
+        if solver_path == "analytic":
+            algorithm_used = "Annuity-Due Formula (Closed Form)"
+        else:
+            algorithm_used = "Binary Search (Successive Approximation)"
         
         # Verify the result
         actual_years = finallyRetired(balance, optimal_expense, rate)
@@ -589,7 +603,7 @@ def scenario_optimal_withdrawal():
             f"Expected Return Rate:    {format_percentage(rate)}",
             f"Target Duration:         {target_years} years",
             "",
-            f"Algorithm Used:          Binary Search (Successive Approximation)",
+            f"Algorithm Used:          {algorithm_used}",
             f"Search Space:            $0 to {format_currency(balance)}",
             "",
             f"{Colors.GOLD}OPTIMAL WITHDRAWAL:      {format_currency(optimal_expense)}{Colors.RESET}",
@@ -0,0 +1,623 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Monte Carlo Simulation
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module extends variableInvestor from a single deterministic rateList
+to many stochastic rate paths:
+- Rate paths are drawn into one (n_paths, n_years) array
+- Balances for every path are computed together with a vectorized cumprod
+- Percentile bands summarise the spread of outcomes year by year
+- Withdrawal plans are run across every path to estimate success rates
+- maximumExpensed is generalised to a target success probability
+
+Every function that draws random numbers takes a seed, so results are
+reproducible. Requires NumPy (see requirements.txt).
+"""
+
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from batch_algorithms import check_rates
+
+
+DISTRIBUTIONS = ("normal", "lognormal", "bootstrap")
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def generate_rate_paths(n_paths, n_years, distribution="normal", mean=0.05,
+                        volatility=0.15, history=None, seed=None):
+    """
+    Draw annual rate paths into a single (n_paths, n_years) array.
+
+    Distributions:
+        "normal":     rate ~ Normal(mean, volatility), floored at -100%
+        "lognormal":  1 + rate ~ LogNormal, with mu and sigma chosen so the
+                      arithmetic mean and volatility of rate match the
+                      arguments; rates can never fall below -100%
+        "bootstrap":  rates resampled with replacement from `history`
+
+    Time Complexity: O(n_paths × n_years)
+    Space Complexity: O(n_paths × n_years)
+
+    Parameters:
+        n_paths (int): Number of simulated paths (must be > 0)
+        n_years (int): Years per path (must be > 0)
+        distribution (str): "normal", "lognormal" or "bootstrap"
+        mean (float): Expected annual rate (normal/lognormal)
+        volatility (float): Standard deviation of the annual rate (>= 0)
+        history (array_like): Historical annual rates (bootstrap only)
+        seed (int, SeedSequence or Generator): Seed for reproducibility
+
+    Returns:
+        numpy.ndarray: Rate paths of shape (n_paths, n_years)
+
+    Raises:
+        ValueError: If sizes are not positive, the distribution is unknown,
+                    volatility is negative, or history is missing/invalid
+    """
+    # Input validation
+    if n_paths <= 0:
+        raise ValueError(f"Number of paths must be positive: {n_paths}")
+    if n_years <= 0:
+        raise ValueError(f"Number of years must be positive: {n_years}")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution must be one of {DISTRIBUTIONS}: {distribution}")
+    if volatility < 0:
+        raise ValueError(f"Volatility cannot be negative: {volatility}")
+
+    rng = np.random.default_rng(seed)
+    shape = (n_paths, n_years)
+
+    if distribution == "normal":
+        rate_paths = rng.normal(mean, volatility, size=shape)
+        # A loss can never exceed the whole balance
+        np.maximum(rate_paths, -1.0, out=rate_paths)
+
+    elif distribution == "lognormal":
+        if mean <= -1.0:
+            raise ValueError(f"Lognormal mean must be greater than -100%: {mean}")
+        # Match E[1 + r] = 1 + mean and Var[r] = volatility^2
+        sigma_squared = np.log1p((volatility / (1.0 + mean)) ** 2)
+        mu = np.log1p(mean) - sigma_squared / 2.0
+        rate_paths = rng.normal(mu, np.sqrt(sigma_squared), size=shape)
+        np.expm1(rate_paths, out=rate_paths)
+
+    else:
+        if history is None:
+            raise ValueError("Bootstrap sampling requires a history of rates")
+        history = np.asarray(history, dtype=float).ravel()
+        if history.size == 0:
+            raise ValueError("history cannot be empty")
+        check_rates(history)
+        rate_paths = rng.choice(history, size=shape, replace=True)
+
+    return rate_paths
+
+
+def balance_paths(principal, rate_paths, overwrite_rates=False):
+    """
+    Year-end balances for every path, following variableInvestor.
+
+    B(t) = principal × (1 + r_1) × ... × (1 + r_t), computed for all paths
+    at once with a cumulative product along the year axis. The product is
+    taken in place on one working array: a copy of the rates by default,
+    or rate_paths itself with overwrite_rates=True, so a caller that no
+    longer needs the rates keeps peak memory at one (n_paths, n_years)
+    array even for 1M-path runs.
+
+    Time Complexity: O(n_paths × n_years)
+    Space Complexity: O(n_paths × n_years)
+
+    Parameters:
+        principal (float): Initial investment (must be >= 0)
+        rate_paths (array_like): Rates of shape (n_paths, n_years)
+        overwrite_rates (bool): Reuse rate_paths for the balances when it is
+                                already a float array (default: False)
+
+    Returns:
+        numpy.ndarray: Balances of shape (n_paths, n_years); column t-1 holds
+                       the balance at the end of year t
+
+    Raises:
+        ValueError: If principal is negative or any rate < -1
+    """
+    rate_paths = np.asarray(rate_paths, dtype=float)
+
+    # Input validation
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+    if rate_paths.ndim != 2 or rate_paths.shape[1] == 0:
+        raise ValueError(f"rate_paths must have shape (n_paths, n_years): {rate_paths.shape}")
+    check_rates(rate_paths)
+
+    if overwrite_rates:
+        balances = rate_paths
+        balances += 1.0
+    else:
+        balances = rate_paths + 1.0
+    np.cumprod(balances, axis=1, out=balances)
+    balances *= principal
+
+    return balances
+
+
+def percentile_bands(balances, percentiles=DEFAULT_PERCENTILES, overwrite_input=False):
+    """
+    Percentiles of the balance across paths for every year.
+
+    Parameters:
+        balances (array_like): Balances of shape (n_paths, n_years)
+        percentiles (sequence of float): Percentiles in [0, 100]
+        overwrite_input (bool): Let the selection reorder balances in place
+                                instead of copying them (default: False)
+
+    Returns:
+        dict: {percentile: numpy.ndarray of shape (n_years,)}
+
+    Raises:
+        ValueError: If any percentile is outside [0, 100]
+    """
+    percentiles = _check_percentiles(percentiles)
+
+    values = np.percentile(balances, percentiles, axis=0, overwrite_input=overwrite_input)
+
+    return {percentile: row for percentile, row in zip(percentiles, values)}
+
+
+def simulate_variable_investor(principal, n_paths, n_years, distribution="normal",
+                               mean=0.05, volatility=0.15, history=None,
+                               percentiles=DEFAULT_PERCENTILES, seed=None):
+    """
+    Monte Carlo version of variableInvestor over stochastic rate paths.
+
+    Algorithm:
+        1. Draw all rate paths into one (n_paths, n_years) array
+        2. Compute every path's balances with one cumprod along the years
+        3. Summarise terminal balances and per-year percentile bands
+
+    Time Complexity: O(n_paths × n_years) plus O(n_paths × n_years) for the
+                     percentile selection
+    Space Complexity: O(n_paths × n_years)
+
+    Parameters:
+        principal (float): Initial investment (must be >= 0)
+        n_paths (int): Number of simulated paths
+        n_years (int): Years per path
+        distribution, mean, volatility, history, seed:
+            See generate_rate_paths
+        percentiles (sequence of float): Percentile bands to report
+
+    Returns:
+        dict: {
+            "terminal_balances": numpy.ndarray of shape (n_paths,),
+            "mean_terminal_balance": float,
+            "percentile_bands": {percentile: numpy.ndarray of shape (n_years,)},
+        }
+
+    Raises:
+        ValueError: On invalid inputs (see generate_rate_paths, balance_paths)
+
+    Example:
+        >>> result = simulate_variable_investor(10000, 100000, 30, seed=42)
+        >>> result["percentile_bands"][50][-1]    # median after 30 years
+    """
+    # Validate before drawing any paths
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+
+    rate_paths = generate_rate_paths(
+        n_paths, n_years, distribution=distribution, mean=mean,
+        volatility=volatility, history=history, seed=seed,
+    )
+    # The rates are not needed afterwards: turn them into balances in place
+    balances = balance_paths(principal, rate_paths, overwrite_rates=True)
+    del rate_paths
+
+    terminal_balances = balances[:, -1].copy()
+
+    return {
+        "terminal_balances": terminal_balances,
+        "mean_terminal_balance": float(terminal_balances.mean()),
+        # Last use of balances: let the percentile selection reorder it
+        "percentile_bands": percentile_bands(balances, percentiles, overwrite_input=True),
+    }
+
+
+def iter_percentile_bands(principal, n_paths, n_years, distribution="normal",
+                          mean=0.05, volatility=0.15, history=None,
+                          percentiles=DEFAULT_PERCENTILES, seed=None):
+    """
+    Stream simulate_variable_investor's percentile bands one year at a time.
+
+    Only the current balance of each path is kept: every year draws that
+    year's rates for all paths, grows the balances in place and yields the
+    percentiles, so memory stays O(n_paths) however many years are asked
+    for. Rates are drawn year by year, so for a given seed the paths
+    differ from generate_rate_paths' (same distribution, different
+    stream).
+
+    Time Complexity: O(n_paths) per year, O(n_paths × n_years) in total
+    Space Complexity: O(n_paths)
+
+    Parameters:
+        See simulate_variable_investor
+
+    Returns:
+        generator: (year, {percentile: float}) for year = 1..n_years
+
+    Raises:
+        ValueError: On invalid inputs; raised by this call, before the
+                    first year is produced
+
+    Example:
+        >>> for year, bands in iter_percentile_bands(10000, 100000, 30, seed=42):
+        ...     print(year, bands[50])
+    """
+    # Validate everything (and draw year 1) before handing out the generator
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+    if n_years <= 0:
+        raise ValueError(f"Number of years must be positive: {n_years}")
+    percentiles = _check_percentiles(percentiles)
+    rng = np.random.default_rng(seed)
+    first_rates = generate_rate_paths(
+        n_paths, 1, distribution=distribution, mean=mean,
+        volatility=volatility, history=history, seed=rng,
+    )[:, 0]
+
+    return _percentile_bands_by_year(
+        principal, first_rates, n_years, distribution, mean, volatility,
+        history, percentiles, rng,
+    )
+
+
+def _percentile_bands_by_year(principal, first_rates, n_years, distribution,
+                              mean, volatility, history, percentiles, rng):
+    """Generator body of iter_percentile_bands."""
+    balances = np.full(first_rates.shape, float(principal))
+    rates = first_rates
+
+    for year in range(1, n_years + 1):
+        if year > 1:
+            rates = generate_rate_paths(
+                len(balances), 1, distribution=distribution, mean=mean,
+                volatility=volatility, history=history, seed=rng,
+            )[:, 0]
+        balances *= 1.0 + rates
+        values = np.percentile(balances, percentiles)
+        yield year, {percentile: float(value) for percentile, value in zip(percentiles, values)}
+
+
+def simulate_ruin(balance, expense, rate_paths, target_years=None):
+    """
+    Probability-of-ruin simulation of a finallyRetired plan over many paths.
+
+    Each path applies the finallyRetired order every year:
+        if balance < expense: the path is depleted and stops
+        otherwise: balance = (balance - expense) × (1 + r_t)
+    A path's depletion year is the number of withdrawals it made, so a
+    constant-rate path gives the same answer as finallyRetired (up to the
+    simulated horizon).
+
+    Algorithm:
+        Year-by-year recurrence over the paths still alive. Depleted paths
+        are dropped from the working arrays as they finish, so each year
+        costs O(paths still alive) rather than O(n_paths).
+
+    Time Complexity: O(sum over years of surviving paths) <= O(n_paths × n_years)
+    Space Complexity: O(n_paths) besides the rate matrix
+
+    Parameters:
+        balance (float): Initial retirement balance (must be >= 0)
+        expense (float): Annual withdrawal (must be >= 0)
+        rate_paths (array_like): Rates of shape (n_paths, n_years)
+        target_years (int): Years a plan must last to count as a success
+                            (default: n_years, must be 1..n_years)
+
+    Returns:
+        dict: {
+            "success_rate": float, fraction of paths lasting >= target_years,
+            "depletion_years": numpy.ndarray of shape (n_paths,), years
+                survived per path; inf if never depleted within n_years,
+            "depletion_year_counts": numpy.ndarray of shape (n_years,), number
+                of paths depleted after exactly t withdrawals at index t,
+            "terminal_balances": numpy.ndarray of shape (n_paths,), balance
+                at depletion (below expense) or at the end of the horizon,
+        }
+
+    Raises:
+        ValueError: If balance or expense is negative, any rate < -1, or
+                    target_years is out of range
+
+    Example:
+        >>> paths = generate_rate_paths(100000, 40, mean=0.05, seed=1)
+        >>> simulate_ruin(1000000, 50000, paths, target_years=30)["success_rate"]
+    """
+    rate_paths = np.asarray(rate_paths, dtype=float)
+
+    # Input validation
+    if balance < 0:
+        raise ValueError(f"Balance cannot be negative: {balance}")
+    if expense < 0:
+        raise ValueError(f"Expense cannot be negative: {expense}")
+    if rate_paths.ndim != 2 or rate_paths.shape[1] == 0:
+        raise ValueError(f"rate_paths must have shape (n_paths, n_years): {rate_paths.shape}")
+    check_rates(rate_paths)
+
+    n_paths, n_years = rate_paths.shape
+    if target_years is None:
+        target_years = n_years
+    if not 1 <= target_years <= n_years:
+        raise ValueError(f"Target years must be between 1 and {n_years}: {target_years}")
+
+    depletion_years = np.full(n_paths, np.inf)
+    terminal_balances = np.empty(n_paths)
+
+    # Working arrays hold only the paths that are still alive
+    alive = np.arange(n_paths)
+    balances = np.full(n_paths, float(balance))
+
+    for year in range(n_years):
+        can_withdraw = balances >= expense
+        if not can_withdraw.all():
+            depleted = alive[~can_withdraw]
+            depletion_years[depleted] = year
+            terminal_balances[depleted] = balances[~can_withdraw]
+            alive = alive[can_withdraw]
+            balances = balances[can_withdraw]
+            if alive.size == 0:
+                break
+
+        # 1. Withdraw annual expense, 2. apply this year's rate
+        balances = (balances - expense) * (1.0 + rate_paths[alive, year])
+
+    terminal_balances[alive] = balances
+
+    finite_years = depletion_years[np.isfinite(depletion_years)].astype(int)
+
+    return {
+        "success_rate": float(np.count_nonzero(depletion_years >= target_years)) / n_paths,
+        "depletion_years": depletion_years,
+        "depletion_year_counts": np.bincount(finite_years, minlength=n_years),
+        "terminal_balances": terminal_balances,
+    }
+
+
+def maximum_expense_for_success(balance, rate_paths, target_years,
+                                success_probability=0.95, confidence=0.95,
+                                method="quantile", epsilon=0.01,
+                                max_iterations=100):
+    """
+    Largest withdrawal that lasts target_years on a given share of paths.
+
+    Stochastic version of maximumExpensed: instead of one fixed rate, the
+    plan must survive target_years on at least success_probability of the
+    supplied rate paths. The same paths are reused for every candidate
+    expense (common random numbers), so the success rate is a monotone
+    step function of the expense.
+
+    Solver Paths:
+        method="quantile" (default):
+            For each path, the largest expense it can sustain for n years is
+                E_i = min over t < n of  balance × G(t) / (1 + S(t))
+            where G(t) = (1 + r_1)...(1 + r_t) and S(t) follows
+            S(t) = (S(t-1) + 1) × (1 + r_t), S(0) = 0. This is the path's own
+            annuity-due bound (B(t) >= expense for every withdrawal year).
+            The answer is then an order statistic of the E_i: exact for the
+            sample, in one vectorized pass, with no search at all.
+        method="bisection":
+            Binary search on [0, balance] as in maximumExpensed, where every
+            step evaluates the success rate of all paths in one vectorized
+            pass (see simulate_ruin).
+
+    Confidence Interval:
+        The answer estimates the (1 - success_probability) quantile of the
+        per-path sustainable expense. The distribution-free interval uses
+        the order statistics at n×q ± z×sqrt(n×q×(1 - q)), q = 1 - success_probability.
+
+    Time Complexity:
+        Quantile: O(n_paths × target_years)
+        Bisection: O(log(balance/epsilon) × n_paths × target_years)
+    Space Complexity: O(n_paths)
+
+    Parameters:
+        balance (float): Initial retirement balance (must be > 0)
+        rate_paths (array_like): Rates of shape (n_paths, n_years), reused
+                                 for every candidate expense
+        target_years (int): Required duration (1..n_years)
+        success_probability (float): Required success share, in (0, 1]
+        confidence (float): Confidence level of the interval, in (0, 1)
+        method (str): "quantile" or "bisection" (default: "quantile")
+        epsilon (float): Bisection convergence threshold (default: 0.01)
+        max_iterations (int): Bisection safety limit (default: 100)
+
+    Returns:
+        dict: {
+            "expense": float, the largest qualifying withdrawal,
+            "success_rate": float, success rate of the expense on the
+                            sample, as simulate_ruin reports it,
+            "confidence_interval": (float, float),
+            "method": str,
+            "iterations": int (0 for the quantile path),
+        }
+
+    Raises:
+        ValueError: On invalid inputs or an unknown method
+    """
+    rate_paths = np.asarray(rate_paths, dtype=float)
+
+    # Input validation
+    if balance <= 0:
+        raise ValueError(f"Balance must be positive: {balance}")
+    if rate_paths.ndim != 2 or rate_paths.shape[1] == 0:
+        raise ValueError(f"rate_paths must have shape (n_paths, n_years): {rate_paths.shape}")
+    if not 1 <= target_years <= rate_paths.shape[1]:
+        raise ValueError(
+            f"Target years must be between 1 and {rate_paths.shape[1]}: {target_years}"
+        )
+    if not 0 < success_probability <= 1:
+        raise ValueError(f"Success probability must be in (0, 1]: {success_probability}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"Confidence must be in (0, 1): {confidence}")
+    if method not in ("quantile", "bisection"):
+        raise ValueError(f"Method must be 'quantile' or 'bisection': {method}")
+    check_rates(rate_paths)
+
+    # Only the first target_years of each path matter
+    rate_paths = rate_paths[:, :target_years]
+    path_expenses = _sustainable_expenses(balance, rate_paths)
+
+    iterations = 0
+    if method == "quantile":
+        expense = _kth_largest(path_expenses, _required_successes(
+            success_probability, len(path_expenses)))
+        # E_k sits exactly on its own path's boundary, where rounding in the
+        # year-by-year simulation can deplete it; step down, doubling the
+        # step, until the plan meets the target on the sample itself
+        success_rate = simulate_ruin(balance, expense, rate_paths)["success_rate"]
+        step = math.ulp(expense)
+        while success_rate < success_probability and expense > 0.0:
+            expense = max(0.0, expense - step)
+            step *= 2.0
+            success_rate = simulate_ruin(balance, expense, rate_paths)["success_rate"]
+    else:
+        low_expense, high_expense = 0.0, float(balance)
+        while (high_expense - low_expense) > epsilon and iterations < max_iterations:
+            mid_expense = (low_expense + high_expense) / 2.0
+            success_rate = simulate_ruin(balance, mid_expense, rate_paths)["success_rate"]
+            if success_rate >= success_probability:
+                # Plan still meets the target → can afford higher expense
+                low_expense = mid_expense
+            else:
+                high_expense = mid_expense
+            iterations += 1
+        # The lower bound always meets the target
+        expense = low_expense
+        success_rate = simulate_ruin(balance, expense, rate_paths)["success_rate"]
+
+    return {
+        "expense": expense,
+        "success_rate": success_rate,
+        "confidence_interval": _quantile_interval(
+            path_expenses, 1.0 - success_probability, confidence),
+        "method": method,
+        "iterations": iterations,
+    }
+
+
+def _sustainable_expenses(balance, rate_paths):
+    """
+    Largest expense each path can sustain for all of its years.
+
+    B(t) = balance × G(t) - expense × S(t) must stay >= expense at every
+    withdrawal year t, i.e. expense <= balance × G(t) / (1 + S(t)).
+    """
+    n_paths, n_years = rate_paths.shape
+    growth = np.ones(n_paths)
+    withdrawn_growth = np.zeros(n_paths)
+    path_expenses = np.full(n_paths, float(balance))
+
+    for year in range(n_years - 1):
+        growth_multiplier = 1.0 + rate_paths[:, year]
+        growth *= growth_multiplier
+        withdrawn_growth = (withdrawn_growth + 1.0) * growth_multiplier
+        np.minimum(path_expenses, balance * growth / (1.0 + withdrawn_growth),
+                   out=path_expenses)
+
+    return path_expenses
+
+
+def _check_percentiles(percentiles):
+    """Return percentiles as a tuple, raising ValueError for any outside [0, 100]."""
+    percentiles = tuple(percentiles)
+    for percentile in percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100: {percentile}")
+    return percentiles
+
+
+def _required_successes(success_probability, n_paths):
+    """Smallest path count whose share reaches success_probability."""
+    # Tolerance keeps e.g. 0.95 × 100000 from rounding up to 95001
+    return max(1, math.ceil(success_probability * n_paths - 1e-9))
+
+
+def _kth_largest(values, k):
+    """k-th largest entry (1-based) in O(n) via partial sorting."""
+    return float(np.partition(values, len(values) - k)[len(values) - k])
+
+
+def _quantile_interval(values, quantile, confidence):
+    """Distribution-free confidence interval for a sample quantile."""
+    n_values = len(values)
+    z_score = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    spread = z_score * math.sqrt(n_values * quantile * (1.0 - quantile))
+
+    low_index = max(0, math.floor(n_values * quantile - spread))
+    high_index = min(n_values - 1, math.ceil(n_values * quantile + spread))
+    low_value, high_value = np.partition(values, (low_index, high_index))[[low_index, high_index]]
+
+    return float(low_value), float(high_value)
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    from retirement_algorithms import finallyRetired, maximumExpensed, variableInvestor
+
+    print("=" * 70)
+    print("MONTE CARLO vs SCALAR ALGORITHMS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    rng = np.random.default_rng(5)
+    rate_paths = generate_rate_paths(500, 40, seed=5)
+
+    # Every path's balances follow variableInvestor on that path's rates
+    balances = balance_paths(10000, rate_paths)
+    check("balance_paths matches variableInvestor on every path and year", all(
+        math.isclose(balances[i, t], variableInvestor(10000, list(rate_paths[i, :t + 1])),
+                     rel_tol=1e-12)
+        for i in range(0, 500, 25) for t in range(40)
+    ))
+
+    # A constant-rate path is a finallyRetired plan; one lasting the whole
+    # 60-year horizon is never seen to deplete (inf)
+    mismatches = 0
+    for balance, expense, rate in zip(rng.uniform(1e4, 1e6, 200), rng.uniform(1e3, 1e5, 200),
+                                      rng.uniform(-0.05, 0.10, 200)):
+        depletion = simulate_ruin(balance, expense, np.full((1, 60), rate))["depletion_years"][0]
+        exact = finallyRetired(balance, expense, rate)
+        mismatches += depletion != (exact if exact < 60 else math.inf)
+    check(f"simulate_ruin on constant rates matches finallyRetired ({mismatches} of 200 differ)",
+          mismatches == 0)
+
+    # With one path per distinct rate, success_probability=1 asks for the
+    # worst path, i.e. maximumExpensed at the lowest rate
+    constant_paths = np.repeat(np.linspace(0.01, 0.06, 6)[:, None], 30, axis=1)
+    exact = maximumExpensed(500000, 0.01, 30)
+    for method in ("quantile", "bisection"):
+        expense = maximum_expense_for_success(500000, constant_paths, 30, success_probability=1.0,
+                                              method=method)["expense"]
+        check(f"maximum_expense_for_success ({method}) on constant paths: "
+              f"{expense:,.2f} vs {exact:,.2f}", abs(expense - exact) <= 0.01)
+
+    # Quantile and bisection agree on random paths, within epsilon
+    answers = [maximum_expense_for_success(1e6, rate_paths, 30, method=method)
+               for method in ("quantile", "bisection")]
+    check("Quantile and bisection answers agree",
+          abs(answers[0]["expense"] - answers[1]["expense"]) <= 0.01
+          and answers[0]["success_rate"] >= 0.95 and answers[1]["success_rate"] >= 0.95)
+
+    print("=" * 70)
@@ -0,0 +1,334 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Parallel (Sharded) Monte Carlo
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module scales monte_carlo.py to 10M+ paths across every core:
+- Paths are split into fixed-size shards, each run on a ProcessPoolExecutor
+- Every shard is seeded with its own SeedSequence child, so the result
+  depends only on (seed, shard_size), never on the number of workers
+- Shards return small mergeable summaries (counts, sums and a fixed
+  log-spaced histogram), never raw paths
+- Summaries are folded into one running total as they arrive, so the
+  parent holds O(bins) memory however many shards there are
+- Shard size and shard count are bounded, so planning a run stays cheap
+
+Design Pattern: Divide-and-Conquer (split paths, solve shards, merge summaries)
+
+Requires NumPy (see requirements.txt).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from monte_carlo import (
+    DEFAULT_PERCENTILES,
+    DISTRIBUTIONS,
+    generate_rate_paths,
+    simulate_ruin,
+)
+
+
+DEFAULT_SHARD_SIZE = 100_000
+
+# Each shard costs a seed, a task and a ~38 KB histogram, so tiny shards
+# (and runs needing more than MAX_SHARDS of them) are rejected
+MIN_SHARD_SIZE = 1_000
+MAX_SHARDS = 10_000
+
+# Terminal balances are histogrammed on a log grid spanning 1e-6 to 1e6
+# times the reference amount (principal, or expense if larger). With 400
+# bins per decade, adjacent edges differ by a factor of 10^(1/400), so each
+# order statistic is placed within ~0.58% of its exact value (see
+# _histogram_percentiles); below the lowest edge the bound is absolute.
+HISTOGRAM_DECADES = (-6, 6)
+HISTOGRAM_BINS_PER_DECADE = 400
+
+
+def run_parallel_monte_carlo(principal, n_paths, n_years, expense=0.0,
+                             distribution="normal", mean=0.05, volatility=0.15,
+                             history=None, percentiles=DEFAULT_PERCENTILES,
+                             seed=None, shard_size=DEFAULT_SHARD_SIZE,
+                             max_workers=None):
+    """
+    Sharded Monte Carlo of variableInvestor / finallyRetired dynamics.
+
+    Each path follows the finallyRetired order every year:
+        withdraw expense (if balance >= expense), then grow by (1 + r_t)
+    With expense == 0 this is exactly variableInvestor on a random rateList.
+    A path whose balance drops below expense is depleted; it stops
+    withdrawing and growing, like finallyRetired's loop exit.
+
+    Algorithm:
+        1. Spawn one SeedSequence child per shard from the root seed
+        2. Run shards on a process pool; each draws its own rate paths and
+           reduces them to counts, sums and a histogram
+        3. Fold shard summaries, in shard order, into a running total and
+           read percentiles off the merged histogram
+
+    Time Complexity: O(n_paths × n_years / workers)
+    Space Complexity: O(shard_size × n_years) per worker; O(bins) in the
+                      parent
+
+    Parameters:
+        principal (float): Starting balance (must be >= 0)
+        n_paths (int): Total number of paths (must be > 0)
+        n_years (int): Years per path (must be > 0)
+        expense (float): Annual withdrawal (must be >= 0, default: 0)
+        distribution, mean, volatility, history:
+            See monte_carlo.generate_rate_paths
+        percentiles (sequence of float): Terminal balance percentiles
+        seed (int or None): Root seed; fixes results for a given shard_size
+        shard_size (int): Paths per shard (at least MIN_SHARD_SIZE, or
+                          n_paths if smaller; at most MAX_SHARDS shards)
+        max_workers (int or None): Process count; 1 runs shards in-process,
+                                   None uses os.cpu_count()
+
+    Returns:
+        dict: {
+            "n_paths": int,
+            "n_shards": int,
+            "success_rate": float (fraction never depleted in n_years),
+            "mean_terminal_balance": float,
+            "terminal_percentiles": {percentile: float},
+        }
+
+    Raises:
+        ValueError: On invalid inputs
+    """
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError(f"max_workers must be positive: {max_workers}")
+
+    shard_args, edges, percentiles = plan_shards(
+        principal, n_paths, n_years, expense, distribution, mean, volatility,
+        history, percentiles, seed, shard_size,
+    )
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    total = None
+    if max_workers == 1 or len(shard_args) == 1:
+        for args in shard_args:
+            total = fold_summary(total, run_shard(*args))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # map preserves shard order, so merging is deterministic
+            for summary in executor.map(run_shard, *zip(*shard_args)):
+                total = fold_summary(total, summary)
+
+    return finish_summary(total, edges, percentiles)
+
+
+# ============================================
+# SHARD PLANNING, WORKER AND MERGE
+# ============================================
+
+def plan_shards(principal, n_paths, n_years, expense, distribution, mean,
+                 volatility, history, percentiles, seed, shard_size):
+    """
+    Validate a run and split it into shards.
+
+    Returns (shard_args, edges, percentiles): one run_shard argument
+    tuple per shard, the histogram edges and the percentiles as a tuple.
+    Also used by jobs.py to queue shards as separate tasks.
+    """
+    # Input validation
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+    if expense < 0:
+        raise ValueError(f"Expense cannot be negative: {expense}")
+    if n_paths <= 0:
+        raise ValueError(f"Number of paths must be positive: {n_paths}")
+    if n_years <= 0:
+        raise ValueError(f"Number of years must be positive: {n_years}")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution must be one of {DISTRIBUTIONS}: {distribution}")
+    if shard_size < min(MIN_SHARD_SIZE, n_paths):
+        raise ValueError(
+            f"Shard size must be at least {MIN_SHARD_SIZE} (or n_paths): {shard_size}"
+        )
+    n_shards = -(-n_paths // shard_size)
+    if n_shards > MAX_SHARDS:
+        raise ValueError(
+            f"{n_shards} shards exceeds the limit of {MAX_SHARDS}; "
+            f"use a shard size of at least {-(-n_paths // MAX_SHARDS)}"
+        )
+    percentiles = tuple(percentiles)
+    for percentile in percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100: {percentile}")
+
+    # Split paths into fixed-size shards with independent seed streams
+    shard_sizes = [shard_size] * (n_paths // shard_size)
+    if n_paths % shard_size:
+        shard_sizes.append(n_paths % shard_size)
+    shard_seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+
+    edges = _histogram_edges(max(principal, expense, 1.0))
+    shard_args = [
+        (principal, size, n_years, expense, distribution, mean, volatility,
+         history, shard_seed, edges)
+        for size, shard_seed in zip(shard_sizes, shard_seeds)
+    ]
+
+    return shard_args, edges, percentiles
+
+
+def run_shard(principal, n_paths, n_years, expense, distribution, mean,
+               volatility, history, seed, edges):
+    """
+    Simulate one shard and reduce it to a mergeable summary.
+
+    Must stay a module-level function so ProcessPoolExecutor can pickle it.
+    """
+    rate_paths = generate_rate_paths(
+        n_paths, n_years, distribution=distribution, mean=mean,
+        volatility=volatility, history=history, seed=seed,
+    )
+
+    ruin = simulate_ruin(principal, expense, rate_paths)
+    balances = ruin["terminal_balances"]
+
+    counts = np.bincount(
+        np.searchsorted(edges, balances, side="right"),
+        minlength=len(edges) + 1,
+    )
+
+    return {
+        "n_paths": n_paths,
+        "n_survived": int(np.count_nonzero(np.isinf(ruin["depletion_years"]))),
+        "balance_sum": float(balances.sum()),
+        "balance_min": float(balances.min()),
+        "balance_max": float(balances.max()),
+        "histogram": counts,
+    }
+
+
+def fold_summary(total, summary):
+    """
+    Merge one shard summary into a running total and return the total.
+
+    total is None before the first shard. Only the total is kept, so
+    memory stays O(bins) however many shards are folded in.
+    """
+    if total is None:
+        return dict(summary, n_shards=1, histogram=summary["histogram"].copy())
+
+    total["n_shards"] += 1
+    total["n_paths"] += summary["n_paths"]
+    total["n_survived"] += summary["n_survived"]
+    total["balance_sum"] += summary["balance_sum"]
+    total["balance_min"] = min(total["balance_min"], summary["balance_min"])
+    total["balance_max"] = max(total["balance_max"], summary["balance_max"])
+    total["histogram"] += summary["histogram"]
+    return total
+
+
+def finish_summary(total, edges, percentiles):
+    """Turn the folded shard summaries into the final statistics."""
+    return {
+        "n_paths": total["n_paths"],
+        "n_shards": total["n_shards"],
+        "success_rate": total["n_survived"] / total["n_paths"],
+        "mean_terminal_balance": total["balance_sum"] / total["n_paths"],
+        "terminal_percentiles": _histogram_percentiles(
+            total["histogram"], edges, total["balance_min"], total["balance_max"],
+            percentiles,
+        ),
+    }
+
+
+def _histogram_edges(reference):
+    """Log-spaced bin edges around the reference amount."""
+    low, high = HISTOGRAM_DECADES
+    n_edges = (high - low) * HISTOGRAM_BINS_PER_DECADE + 1
+    return reference * np.logspace(low, high, n_edges)
+
+
+def _histogram_percentiles(histogram, edges, balance_min, balance_max, percentiles):
+    """
+    Estimate np.percentile (its default linear method) from a merged histogram.
+
+    np.percentile interpolates between the order statistics at ranks
+    floor(q × (n - 1)) and the one after it. Each of those is found in its
+    own bin from the cumulative counts and placed at its position among
+    that bin's entries, spread evenly over [edges[k], edges[k + 1]). Empty
+    bins are never interpolated across, so point masses and gaps between
+    modes are reported where the data is.
+
+    Bin 0 covers [0, edges[0]) and the last bin covers [edges[-1], max].
+    Every bin is clipped to [balance_min, balance_max], so a distribution
+    concentrated in one bin (e.g. zero volatility) is reported exactly.
+    """
+    lower_bounds = np.clip(np.concatenate(([0.0], edges)), balance_min, balance_max)
+    upper_bounds = np.clip(np.concatenate((edges, [balance_max])), balance_min, balance_max)
+    cumulative = np.cumsum(histogram)
+    n_values = int(cumulative[-1])
+
+    def order_statistic(index):
+        # First bin holding more than `index` values contains the index-th one
+        k = int(np.searchsorted(cumulative, index, side="right"))
+        position = (index - (cumulative[k] - histogram[k]) + 0.5) / histogram[k]
+        return lower_bounds[k] + position * (upper_bounds[k] - lower_bounds[k])
+
+    results = {}
+    for percentile in percentiles:
+        rank = percentile / 100.0 * (n_values - 1)
+        index = int(rank)
+        low_value = order_statistic(index)
+        high_value = order_statistic(min(index + 1, n_values - 1))
+        results[percentile] = float(low_value + (rank - index) * (high_value - low_value))
+    return results
+
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("PARALLEL MONTE CARLO - HISTOGRAM PERCENTILE CHECKS")
+    print("=" * 70)
+
+    def check_against_numpy(name, balances, tolerance):
+        """Histogram percentiles of a sample vs np.percentile on the raw sample."""
+        edges = _histogram_edges(max(float(np.median(balances)), 1.0))
+        histogram = np.bincount(np.searchsorted(edges, balances, side="right"),
+                                minlength=len(edges) + 1)
+        estimated = _histogram_percentiles(histogram, edges, balances.min(),
+                                           balances.max(), DEFAULT_PERCENTILES)
+        exact = dict(zip(DEFAULT_PERCENTILES, np.percentile(balances, DEFAULT_PERCENTILES)))
+        worst = max(abs(estimated[p] - exact[p]) / max(abs(exact[p]), 1e-12)
+                    for p in DEFAULT_PERCENTILES)
+        print(f"{name}: worst relative error {worst:.2e} "
+              f"{'✓ PASS' if worst <= tolerance else '✗ FAIL'}")
+
+    # Zero volatility: every path ends on the same balance
+    degenerate = run_parallel_monte_carlo(1e6, 20000, 30, expense=60000, volatility=0.0,
+                                          seed=1, shard_size=5000, max_workers=1)
+    expected = simulate_ruin(1e6, 60000, np.full((1, 30), 0.05))["terminal_balances"][0]
+    worst = max(abs(value - expected) for value in degenerate["terminal_percentiles"].values())
+    print(f"Zero volatility: every percentile {expected:,.2f}, worst miss {worst:.2e} "
+          f"{'✓ PASS' if worst <= 1e-6 * expected else '✗ FAIL'}")
+
+    rng = np.random.default_rng(7)
+    check_against_numpy("Point mass", np.full(10_000, 136_295.17), 1e-12)
+    # Bimodal samples land within one bin width of the exact percentiles,
+    # including two point masses with a wide empty gap between them
+    bin_width = 10 ** (1 / HISTOGRAM_BINS_PER_DECADE) - 1
+    check_against_numpy("Bimodal 50/50", np.repeat([20_000.0, 900_000.0], 5_000), bin_width)
+    check_against_numpy("Bimodal 30/70", np.repeat([20_000.0, 900_000.0], [3_000, 7_000]),
+                        bin_width)
+    clusters = np.concatenate((rng.lognormal(np.log(5e4), 0.1, 30_000),
+                               rng.lognormal(np.log(2e6), 0.3, 70_000)))
+    check_against_numpy("Bimodal lognormal", clusters, bin_width)
+
+    print("=" * 70)
@@ -0,0 +1,213 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Rate Series Index
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module precomputes a rate series once so that variableInvestor can be
+answered for any window of years in O(1):
+- Prefix sums of log(1 + rate) turn a window's product into a difference
+- Compensated (Neumaier) summation keeps long windows accurate
+- Total-loss years (rate == -100%) are counted separately, since their
+  logarithm is -inf
+
+Requires NumPy (see requirements.txt).
+"""
+
+import numpy as np
+
+from batch_algorithms import check_rates
+
+
+class RateSeriesIndex:
+    """
+    Prefix index over an annual rate series.
+
+    Mathematical Basis:
+        growth(i, j) = (1 + r_i) × ... × (1 + r_{j-1})
+                     = exp(L(j) - L(i))    where L(k) = log1p(r_0) + ... + log1p(r_{k-1})
+
+    Each prefix L(k) is stored as a (high, low) pair from Neumaier
+    summation, and window differences subtract both parts, so the error of
+    a window does not grow with its position in the series.
+
+    Time Complexity: O(n) to build, O(1) per window, O(n) for all windows
+                     of one length
+    Space Complexity: O(n)
+
+    Example:
+        >>> index = RateSeriesIndex([0.05, 0.03, -0.02, 0.10])
+        >>> index.growth_factor(0, 3)             # years 0, 1 and 2
+        1.05987
+        >>> index.window_balance(10000, 0, 3)     # == variableInvestor(10000, rates[0:3])
+        10598.7
+    """
+
+    def __init__(self, rates):
+        """
+        Build the index.
+
+        Parameters:
+            rates (array_like): Annual rates as decimals (each >= -1)
+
+        Raises:
+            ValueError: If rates is empty, not 1-D, or contains a rate < -1
+        """
+        rates = np.asarray(rates, dtype=float)
+
+        # Input validation
+        if rates.ndim != 1 or rates.size == 0:
+            raise ValueError(f"rates must be a non-empty 1-D series: shape {rates.shape}")
+        check_rates(rates)
+
+        self.rates = rates
+
+        # Total-loss years have log1p = -inf; count them instead
+        total_loss = rates == -1.0
+        self._loss_counts = np.concatenate(([0], np.cumsum(total_loss)))
+
+        with np.errstate(divide="ignore"):
+            log_growth = np.where(total_loss, 0.0, np.log1p(rates))
+
+        self._log_high, self._log_low = _compensated_prefix_sums(log_growth)
+
+    def __len__(self):
+        return len(self.rates)
+
+    def growth_factor(self, start, end):
+        """
+        Growth factor of years [start, end) in O(1).
+
+        Parameters:
+            start (int): First year index (0 <= start <= end)
+            end (int): One past the last year index (end <= len(self))
+
+        Returns:
+            float: Product of (1 + rate) over the window (1.0 if empty)
+
+        Raises:
+            ValueError: If the window is out of range
+        """
+        self._check_window(start, end)
+
+        if self._loss_counts[end] - self._loss_counts[start] > 0:
+            return 0.0
+
+        return float(np.exp(self._window_log(start, end)))
+
+    def window_balance(self, principal, start, end):
+        """
+        variableInvestor(principal, rates[start:end]) in O(1).
+
+        Raises:
+            ValueError: If principal is negative or the window is out of range
+        """
+        if principal < 0:
+            raise ValueError(f"Principal cannot be negative: {principal}")
+
+        return principal * self.growth_factor(start, end)
+
+    def rolling_growth_factors(self, window):
+        """
+        Growth factors of every window of `window` consecutive years.
+
+        Parameters:
+            window (int): Window length (1 <= window <= len(self))
+
+        Returns:
+            numpy.ndarray: Shape (len(self) - window + 1,); entry i is
+                           growth_factor(i, i + window)
+
+        Raises:
+            ValueError: If window is out of range
+        """
+        if not 1 <= window <= len(self):
+            raise ValueError(f"Window must be between 1 and {len(self)}: {window}")
+
+        starts = np.arange(len(self) - window + 1)
+        ends = starts + window
+
+        factors = np.exp(self._window_log(starts, ends))
+        has_total_loss = self._loss_counts[ends] - self._loss_counts[starts] > 0
+
+        return np.where(has_total_loss, 0.0, factors)
+
+    def _window_log(self, starts, ends):
+        """Compensated L(end) - L(start); works on ints or index arrays."""
+        return ((self._log_high[ends] - self._log_high[starts])
+                + (self._log_low[ends] - self._log_low[starts]))
+
+    def _check_window(self, start, end):
+        """Raise ValueError unless 0 <= start <= end <= len(self)."""
+        if not 0 <= start <= end <= len(self):
+            raise ValueError(
+                f"Window [{start}, {end}) must lie within [0, {len(self)}]"
+            )
+
+
+def _compensated_prefix_sums(values):
+    """
+    Neumaier-compensated prefix sums.
+
+    Returns (high, low) arrays of length len(values) + 1 such that
+    high[k] + low[k] is the sum of values[:k] to within about one rounding
+    error, regardless of k.
+    """
+    high = np.zeros(len(values) + 1)
+    low = np.zeros(len(values) + 1)
+
+    running_sum = 0.0
+    compensation = 0.0
+    for position, value in enumerate(values.tolist(), 1):
+        total = running_sum + value
+        if abs(running_sum) >= abs(value):
+            compensation += (running_sum - total) + value
+        else:
+            compensation += (value - total) + running_sum
+        running_sum = total
+        high[position] = running_sum
+        low[position] = compensation
+
+    return high, low
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    from retirement_algorithms import variableInvestor
+
+    print("=" * 70)
+    print("RATE SERIES INDEX CHECKS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    rng = np.random.default_rng(8)
+    rates = rng.normal(0.07, 0.18, 2000).clip(-0.9)
+    rates[[300, 1500]] = -1.0                       # total-loss years
+    index = RateSeriesIndex(rates)
+
+    # Any window == variableInvestor on that slice of the series
+    worst = 0.0
+    for start, end in rng.integers(0, 2001, (500, 2)):
+        start, end = sorted((int(start), int(end)))
+        exact = variableInvestor(10000, list(rates[start:end])) if end > start else 10000.0
+        got = index.window_balance(10000, start, end)
+        worst = max(worst, abs(got - exact) / exact if exact else abs(got))
+    check(f"window_balance vs variableInvestor, worst relative error {worst:.1e}",
+          worst <= 1e-12)
+
+    # Rolling windows == growth_factor of each window, zero across a total loss
+    rolling = index.rolling_growth_factors(30)
+    check("rolling_growth_factors == growth_factor for every window",
+          np.allclose(rolling, [index.growth_factor(i, i + 30) for i in range(len(rates) - 29)],
+                      rtol=1e-13, atol=0.0)
+          and rolling[290] == 0.0 and rolling[301] > 0.0)
+
+    print("=" * 70)
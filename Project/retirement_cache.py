@@ -0,0 +1,296 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Memoization Layer
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module provides opt-in cached versions of the four core algorithms
+for traffic that repeats the same inputs:
+- Float inputs are quantized (money to cents, rates to basis points) so
+  near-identical requests share one cache entry; the raw inputs are
+  validated first, so quantizing never turns invalid input into valid
+- The cache is bounded with least-recently-used (LRU) eviction
+- Hit/miss/eviction counters are updated under a lock (thread-safe)
+- Calls that raise (e.g. validation errors) are never cached
+
+Usage:
+    from retirement_cache import cached_maximumExpensed
+    cached_maximumExpensed(500000, 0.04, target_years=25)
+    cached_maximumExpensed.cache_info()
+    cached_maximumExpensed.cache_clear()
+"""
+
+import functools
+import inspect
+import threading
+from collections import OrderedDict, namedtuple
+
+from retirement_algorithms import (
+    fixedInvestor,
+    variableInvestor,
+    finallyRetired,
+    maximumExpensed,
+)
+
+
+DEFAULT_MAXSIZE = 4096
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+def quantize_cents(amount):
+    """
+    Round a money amount to the nearest cent (non-numbers pass through).
+
+    Amounts that would round to zero are kept as they are: a zero expense
+    or balance is a different plan (a perpetuity, or an invalid fund).
+    """
+    if not isinstance(amount, (int, float)):
+        return amount
+    rounded = round(float(amount), 2)
+    return rounded if rounded != 0.0 else amount
+
+
+def quantize_basis_points(rate):
+    """
+    Round a decimal rate to the nearest basis point (non-numbers pass through).
+
+    Rates that would round onto -100% are kept as they are: inflation must
+    stay above -1, and a rate of exactly -1 takes different solver paths.
+    """
+    if not isinstance(rate, (int, float)):
+        return rate
+    rounded = round(float(rate), 4)
+    return rounded if rounded != -1.0 or rate == -1.0 else rate
+
+
+def quantize_rate_list(rates):
+    """
+    Round every rate in a list to the nearest basis point.
+
+    Non-lists pass through unchanged so variableInvestor still raises its
+    own TypeError for them.
+    """
+    if not isinstance(rates, list):
+        return rates
+    return [quantize_basis_points(rate) for rate in rates]
+
+
+def quantized_lru_cache(quantizers, maxsize=DEFAULT_MAXSIZE, validate=None):
+    """
+    Decorator: LRU memoization keyed on quantized arguments.
+
+    Arguments are bound to the wrapped function's signature (so positional
+    and keyword spellings share entries), checked by validate() while still
+    raw, quantized by name, and the wrapped function is called with the
+    quantized values. Every cached result is therefore exactly what the
+    function returns for its key, and raw input the function would reject
+    is rejected even when its quantized key is cached.
+
+    Time Complexity: O(k) per call to build the key (k = argument size),
+                     O(1) for the cache lookup and LRU update
+    Space Complexity: O(maxsize)
+
+    Parameters:
+        quantizers (dict): {parameter name: function(value) -> quantized value}
+        maxsize (int): Maximum number of entries (must be > 0)
+        validate (function): validate(**arguments) raising for raw
+                             arguments the function would reject
+                             (default: None)
+
+    Returns:
+        function: Decorator adding cache_info() and cache_clear() to the
+                  wrapped function
+
+    Raises:
+        ValueError: If maxsize is not positive
+    """
+    if maxsize <= 0:
+        raise ValueError(f"maxsize must be positive: {maxsize}")
+
+    def decorator(function):
+        signature = inspect.signature(function)
+        entries = OrderedDict()
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if validate is not None:
+                validate(**bound.arguments)
+            for name, quantize in quantizers.items():
+                bound.arguments[name] = quantize(bound.arguments[name])
+
+            key = tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in bound.arguments.items()
+            )
+
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    stats["hits"] += 1
+                    return entries[key]
+                stats["misses"] += 1
+
+            # Compute outside the lock; exceptions propagate uncached
+            result = function(*bound.args, **bound.kwargs)
+
+            with lock:
+                entries[key] = result
+                entries.move_to_end(key)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+                    stats["evictions"] += 1
+
+            return result
+
+        def cache_info():
+            """Report hits, misses, evictions, maxsize and current size."""
+            with lock:
+                return CacheInfo(stats["hits"], stats["misses"], stats["evictions"],
+                                 maxsize, len(entries))
+
+        def cache_clear():
+            """Drop every entry and reset the counters."""
+            with lock:
+                entries.clear()
+                stats.update(hits=0, misses=0, evictions=0)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+# ============================================
+# RAW-INPUT VALIDATORS
+# ============================================
+# Same checks and messages as the core algorithms, limited to the
+# arguments that are quantized; the rest reach the function unchanged and
+# are validated there.
+
+def _validate_fixedInvestor(principal, rate, **_):
+    """fixedInvestor's checks on principal and rate."""
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+    if rate < -1.0:
+        raise ValueError(f"Rate cannot be less than -100%: {rate}")
+
+
+def _validate_variableInvestor(principal, rateList, **_):
+    """variableInvestor's checks on principal and each rate."""
+    if principal < 0:
+        raise ValueError(f"Principal cannot be negative: {principal}")
+    if isinstance(rateList, list):
+        for i, rate in enumerate(rateList):
+            if isinstance(rate, (int, float)) and rate < -1.0:
+                raise ValueError(f"Rate at index {i} cannot be less than -100%: {rate}")
+
+
+def _validate_finallyRetired(balance, expense, rate, inflation, **_):
+    """finallyRetired's checks on balance, expense, rate and inflation."""
+    if balance < 0:
+        raise ValueError(f"Balance cannot be negative: {balance}")
+    if expense < 0:
+        raise ValueError(f"Expense cannot be negative: {expense}")
+    if rate < -1.0:
+        raise ValueError(f"Rate cannot be less than -100%: {rate}")
+    if inflation <= -1.0:
+        raise ValueError(f"Inflation must be greater than -100%: {inflation}")
+
+
+def _validate_maximumExpensed(balance, rate, inflation, **_):
+    """maximumExpensed's checks on balance, rate and inflation."""
+    if balance <= 0:
+        raise ValueError(f"Balance must be positive: {balance}")
+    if rate < -1.0:
+        raise ValueError(f"Rate cannot be less than -100%: {rate}")
+    if inflation <= -1.0:
+        raise ValueError(f"Inflation must be greater than -100%: {inflation}")
+
+
+# ============================================
+# CACHED CORE ALGORITHMS
+# ============================================
+
+cached_fixedInvestor = quantized_lru_cache({
+    "principal": quantize_cents,
+    "rate": quantize_basis_points,
+}, validate=_validate_fixedInvestor)(fixedInvestor)
+
+cached_variableInvestor = quantized_lru_cache({
+    "principal": quantize_cents,
+    "rateList": quantize_rate_list,
+}, validate=_validate_variableInvestor)(variableInvestor)
+
+cached_finallyRetired = quantized_lru_cache({
+    "balance": quantize_cents,
+    "expense": quantize_cents,
+    "rate": quantize_basis_points,
+    "inflation": quantize_basis_points,
+}, validate=_validate_finallyRetired)(finallyRetired)
+
+cached_maximumExpensed = quantized_lru_cache({
+    "balance": quantize_cents,
+    "rate": quantize_basis_points,
+    "inflation": quantize_basis_points,
+}, validate=_validate_maximumExpensed)(maximumExpensed)
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("MEMOIZATION CHECKS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    # Cached answers equal the uncached function on the quantized inputs
+    cached_maximumExpensed.cache_clear()
+    first = cached_maximumExpensed(500000, 0.04, target_years=25)
+    again = cached_maximumExpensed(500000.001, 0.040000001, 25)
+    check("Cached maximumExpensed equals maximumExpensed",
+          first == maximumExpensed(500000, 0.04, target_years=25))
+    check("Inputs within a cent / basis point share one entry",
+          first == again and cached_maximumExpensed.cache_info()[:2] == (1, 1))
+
+    cached_variableInvestor.cache_clear()
+    check("Rate lists are keyed by value",
+          cached_variableInvestor(10000, [0.05, 0.03]) == variableInvestor(10000, [0.05, 0.03])
+          and cached_variableInvestor(10000, [0.05, 0.03]) == variableInvestor(10000, [0.05, 0.03])
+          and cached_variableInvestor.cache_info().hits == 1)
+
+    # Invalid raw input is rejected before quantizing and never cached
+    cached_finallyRetired.cache_clear()
+    try:
+        cached_finallyRetired(-0.001, 1000, 0.05)
+        rejected = False
+    except ValueError:
+        rejected = True
+    check("Balance of -0.001 is rejected, not rounded to 0",
+          rejected and cached_finallyRetired.cache_info().currsize == 0)
+    check("A rate just above -100% is kept off -100%", quantize_basis_points(-0.99999) > -1.0)
+
+    # The least recently used entry is evicted first
+    square = quantized_lru_cache({"value": quantize_cents}, maxsize=2)(lambda value: value ** 2)
+    square(1.0)
+    square(2.0)
+    square(1.0)
+    square(3.0)
+    square(1.0)
+    info = square.cache_info()
+    check(f"LRU eviction keeps recently used entries ({info})",
+          info.hits == 2 and info.evictions == 1 and info.currsize == 2)
+
+    print("=" * 70)
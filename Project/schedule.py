@@ -0,0 +1,256 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Editable Contribution Schedule
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module supports interactive what-if edits to a year-by-year schedule
+of contributions and rates without re-running the whole simulation:
+- Each year is an affine map  B -> (B + c_t) × (1 + r_t) = a_t × B + b_t
+- A segment tree stores the composition of every aligned block of years
+- Editing one year or querying any range touches O(log n) nodes
+
+fixedInvestor is the special case c_t = principal, r_t = rate, and
+variableInvestor is the special case c_t = 0 with a starting balance.
+
+Design Pattern: Divide-and-Conquer (segment tree over composed maps)
+"""
+
+
+# Identity map: B -> 1 × B + 0
+_IDENTITY = (1.0, 0.0)
+
+
+def _compose(first, second):
+    """
+    Map that applies `first` and then `second`.
+
+    second(first(B)) = a2 × (a1 × B + b1) + b2 = (a2 × a1) × B + (a2 × b1 + b2)
+    """
+    first_scale, first_shift = first
+    second_scale, second_shift = second
+    return (second_scale * first_scale, second_scale * first_shift + second_shift)
+
+
+class ContributionSchedule:
+    """
+    Year-by-year contribution/rate schedule backed by a segment tree.
+
+    Recurrence (per year t = 0, 1, ..., n-1):
+        B(t+1) = (B(t) + contributions[t]) × (1 + rates[t])
+
+    Time Complexity: O(n) to build, O(log n) per edit or range query
+    Space Complexity: O(n)
+
+    Example:
+        >>> schedule = ContributionSchedule([0.05] * 3, [7500] * 3)
+        >>> schedule.final_balance()                # == fixedInvestor(7500, 0.05, 3)
+        24825.9375
+        >>> schedule.update(1, rate=-0.10)          # what if year 2 is a crash?
+        >>> schedule.balance_at(2)
+        13837.5
+    """
+
+    def __init__(self, rates, contributions=None):
+        """
+        Build the schedule.
+
+        Parameters:
+            rates (list of float): Annual rates as decimals (each >= -1)
+            contributions (list of float): Contribution at the start of each
+                                           year (each >= 0, default: all 0)
+
+        Raises:
+            ValueError: If the lists are empty, differ in length, or hold
+                        invalid values
+            TypeError: If any value is not numeric
+        """
+        rates = list(rates)
+        contributions = [0.0] * len(rates) if contributions is None else list(contributions)
+
+        # Input validation
+        if len(rates) == 0:
+            raise ValueError("rates cannot be empty")
+        if len(contributions) != len(rates):
+            raise ValueError(
+                f"contributions ({len(contributions)}) and rates ({len(rates)}) "
+                f"must have the same length"
+            )
+        for year, (rate, contribution) in enumerate(zip(rates, contributions)):
+            _check_year(year, rate, contribution)
+
+        self.rates = [float(rate) for rate in rates]
+        self.contributions = [float(contribution) for contribution in contributions]
+
+        # Leaves live at [size, size + n); padding leaves stay the identity
+        self._size = 1
+        while self._size < len(rates):
+            self._size *= 2
+        self._tree = [_IDENTITY] * (2 * self._size)
+
+        for year in range(len(rates)):
+            self._tree[self._size + year] = self._year_map(year)
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = _compose(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def __len__(self):
+        return len(self.rates)
+
+    def update(self, year, rate=None, contribution=None):
+        """
+        Change one year's rate and/or contribution in O(log n).
+
+        Parameters:
+            year (int): Year index (0 <= year < len(self))
+            rate (float): New rate, or None to keep the current one
+            contribution (float): New contribution, or None to keep it
+
+        Raises:
+            IndexError: If year is out of range
+            ValueError: If the new values are invalid
+        """
+        if not 0 <= year < len(self):
+            raise IndexError(f"Year must be between 0 and {len(self) - 1}: {year}")
+
+        new_rate = self.rates[year] if rate is None else rate
+        new_contribution = self.contributions[year] if contribution is None else contribution
+        _check_year(year, new_rate, new_contribution)
+
+        self.rates[year] = float(new_rate)
+        self.contributions[year] = float(new_contribution)
+
+        # Recompute the leaf and every ancestor on the path to the root
+        node = self._size + year
+        self._tree[node] = self._year_map(year)
+        node //= 2
+        while node >= 1:
+            self._tree[node] = _compose(self._tree[2 * node], self._tree[2 * node + 1])
+            node //= 2
+
+    def range_map(self, start, end):
+        """
+        Composed affine map (scale, shift) of years [start, end) in O(log n).
+
+        Applying it to a balance B at the start of year `start` gives the
+        balance at the end of year end - 1: scale × B + shift.
+
+        Raises:
+            ValueError: If the range is out of bounds
+        """
+        if not 0 <= start <= end <= len(self):
+            raise ValueError(f"Range [{start}, {end}) must lie within [0, {len(self)}]")
+
+        # Bottom-up query; maps are not commutative, so the left and right
+        # halves are accumulated separately and joined at the end
+        left_map = _IDENTITY
+        right_map = _IDENTITY
+        low = start + self._size
+        high = end + self._size
+        while low < high:
+            if low % 2 == 1:
+                left_map = _compose(left_map, self._tree[low])
+                low += 1
+            if high % 2 == 1:
+                high -= 1
+                right_map = _compose(self._tree[high], right_map)
+            low //= 2
+            high //= 2
+
+        return _compose(left_map, right_map)
+
+    def balance_over(self, start, end, initial_balance=0.0):
+        """
+        Balance at the end of year end - 1 when starting year `start`
+        with initial_balance, in O(log n).
+        """
+        if initial_balance < 0:
+            raise ValueError(f"Initial balance cannot be negative: {initial_balance}")
+
+        scale, shift = self.range_map(start, end)
+        return scale * initial_balance + shift
+
+    def balance_at(self, years, initial_balance=0.0):
+        """Balance after the first `years` years of the schedule, in O(log n)."""
+        return self.balance_over(0, years, initial_balance)
+
+    def final_balance(self, initial_balance=0.0):
+        """Balance after the whole schedule, in O(1)."""
+        if initial_balance < 0:
+            raise ValueError(f"Initial balance cannot be negative: {initial_balance}")
+
+        scale, shift = self._tree[1]
+        return scale * initial_balance + shift
+
+    def _year_map(self, year):
+        """Affine map of a single year: B -> (B + c) × (1 + r)."""
+        growth_multiplier = 1.0 + self.rates[year]
+        return (growth_multiplier, self.contributions[year] * growth_multiplier)
+
+
+def _check_year(year, rate, contribution):
+    """Validate one year's entries the same way the core algorithms do."""
+    if not isinstance(rate, (int, float)):
+        raise TypeError(f"Rate at index {year} must be numeric: {rate}")
+    if not isinstance(contribution, (int, float)):
+        raise TypeError(f"Contribution at index {year} must be numeric: {contribution}")
+    if rate < -1.0:
+        raise ValueError(f"Rate at index {year} cannot be less than -100%: {rate}")
+    if contribution < 0:
+        raise ValueError(f"Contribution at index {year} cannot be negative: {contribution}")
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    import random
+
+    from retirement_algorithms import fixedInvestor, variableInvestor
+
+    print("=" * 70)
+    print("CONTRIBUTION SCHEDULE CHECKS")
+    print("=" * 70)
+
+    def check(name, passed):
+        print(f"{name}: {'✓ PASS' if passed else '✗ FAIL'}")
+
+    def replay(rates, contributions, start, end, balance):
+        """The schedule's recurrence, one year at a time (the reference)."""
+        for year in range(start, end):
+            balance = (balance + contributions[year]) * (1.0 + rates[year])
+        return balance
+
+    check("Constant schedule == fixedInvestor",
+          abs(ContributionSchedule([0.05] * 30, [7500] * 30).final_balance()
+              - fixedInvestor(7500, 0.05, 30)) <= 1e-9 * fixedInvestor(7500, 0.05, 30))
+    rates = [0.05, 0.03, -0.02, 0.10, -1.0, 0.07]
+    check("No contributions == variableInvestor",
+          abs(ContributionSchedule(rates[:4]).final_balance(10000)
+              - variableInvestor(10000, rates[:4])) <= 1e-9)
+
+    # Random edits and range queries agree with replaying the years
+    generator = random.Random(6)
+    n_years = 37
+    rates = [generator.uniform(-0.3, 0.3) for _ in range(n_years)]
+    contributions = [generator.uniform(0, 10000) for _ in range(n_years)]
+    schedule = ContributionSchedule(rates, contributions)
+    mismatches = 0
+    for _ in range(500):
+        year = generator.randrange(n_years)
+        rates[year] = generator.choice([generator.uniform(-0.3, 0.3), -1.0])
+        contributions[year] = generator.uniform(0, 10000)
+        schedule.update(year, rate=rates[year], contribution=contributions[year])
+
+        start = generator.randrange(n_years + 1)
+        end = generator.randrange(start, n_years + 1)
+        expected = replay(rates, contributions, start, end, 5000.0)
+        mismatches += abs(schedule.balance_over(start, end, 5000.0) - expected) > 1e-9 * max(
+            expected, 1.0)
+    check(f"500 random edits + range queries match a full replay ({mismatches} differ)",
+          mismatches == 0)
+
+    print("=" * 70)
@@ -0,0 +1,227 @@
+"""
+CIT3003 - Analysis of Algorithms
+Retirement Investment Optimization - Request Coalescing (Single-Flight)
+
+Group Members:
+Shavon Gordon - 2306989
+Halmareo Francis - 2002360
+Rushane Green - 2006930
+Khadejah Benjamin - 2208656
+
+This module collapses identical concurrent calls into one computation:
+- The first caller for a key runs the function (the leader)
+- Callers arriving with the same key while it runs wait for the leader
+  and receive its result, or its exception
+- Nothing is remembered after the leader finishes; later calls compute
+  afresh (combine with retirement_cache for that)
+- Counters report how many calls were collapsed
+
+Arguments are normalized before keying: they are bound to the function's
+signature with defaults applied, so positional and keyword spellings
+share one key, and lists become tuples.
+
+Usage:
+    from single_flight import coalesced_maximumExpensed
+    coalesced_maximumExpensed(500000, 0.04, target_years=25)
+    coalesced_maximumExpensed.flight_info()
+"""
+
+import functools
+import inspect
+import threading
+from collections import namedtuple
+
+from retirement_algorithms import (
+    fixedInvestor,
+    variableInvestor,
+    finallyRetired,
+    maximumExpensed,
+)
+
+
+FlightInfo = namedtuple("FlightInfo", ["calls", "executions", "coalesced", "in_flight"])
+
+
+class SingleFlight:
+    """
+    Group of in-flight calls keyed by hashable keys (thread-safe).
+
+    Time Complexity: O(1) bookkeeping per call
+    Space Complexity: O(k) where k = distinct keys currently in flight
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        Run function(*args, **kwargs), or wait for the identical call
+        already running under `key` and return its outcome.
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._in_flight.get(key)
+            if call is None:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._in_flight[key] = call
+                self._stats["executions"] += 1
+                leader = True
+            else:
+                self._stats["coalesced"] += 1
+                leader = False
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = function(*args, **kwargs)
+        except BaseException as error:
+            # Includes KeyboardInterrupt/SystemExit: a waiter must never
+            # read the unset result as a successful None
+            call["error"] = error
+            raise
+        finally:
+            # Later callers start a new flight; waiters read this one's outcome
+            with self._lock:
+                del self._in_flight[key]
+            call["done"].set()
+
+        return call["result"]
+
+    def info(self):
+        """Report calls, executions, coalesced calls and keys in flight."""
+        with self._lock:
+            return FlightInfo(self._stats["calls"], self._stats["executions"],
+                              self._stats["coalesced"], len(self._in_flight))
+
+    def reset_info(self):
+        """Zero the counters (calls in flight are unaffected)."""
+        with self._lock:
+            self._stats.update(calls=0, executions=0, coalesced=0)
+
+
+def single_flight(function):
+    """
+    Decorator: coalesce concurrent calls with the same normalized arguments.
+
+    Calls whose arguments cannot be hashed even after list-to-tuple
+    conversion run on their own, without coalescing.
+
+    Returns:
+        function: Wrapper with flight_info() and reset_flight_info() added
+    """
+    signature = inspect.signature(function)
+    group = SingleFlight()
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = tuple((name, _hashable(value)) for name, value in bound.arguments.items())
+
+        try:
+            hash(key)
+        except TypeError:
+            return function(*args, **kwargs)
+
+        return group.do(key, function, *args, **kwargs)
+
+    wrapper.flight_info = group.info
+    wrapper.reset_flight_info = group.reset_info
+    return wrapper
+
+
+def _hashable(value):
+    """Lists (also nested) as tuples, so rate lists can be part of a key."""
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+# ============================================
+# COALESCED CORE ALGORITHMS
+# ============================================
+
+coalesced_fixedInvestor = single_flight(fixedInvestor)
+coalesced_variableInvestor = single_flight(variableInvestor)
+coalesced_finallyRetired = single_flight(finallyRetired)
+coalesced_maximumExpensed = single_flight(maximumExpensed)
+
+
+# ============================================
+# SELF-TEST
+# ============================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("SINGLE-FLIGHT CHECKS")
+    print("=" * 70)
+
+    def run_concurrently(group, key, function, n_callers):
+        """
+        Start a leader, wait until n_callers - 1 others are waiting on its
+        flight, then let it finish. Returns each caller's outcome.
+        """
+        release = threading.Event()
+        outcomes = [None] * n_callers
+
+        def gated():
+            release.wait()
+            return function()
+
+        def call(index):
+            try:
+                outcomes[index] = ("result", group.do(key, gated))
+            except BaseException as error:
+                outcomes[index] = ("error", error)
+
+        threads = [threading.Thread(target=call, args=(index,)) for index in range(n_callers)]
+        threads[0].start()
+        while group.info().in_flight == 0:
+            time.sleep(0.001)
+        for thread in threads[1:]:
+            thread.start()
+        while group.info().calls < n_callers:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        return outcomes
+
+    group = SingleFlight()
+    outcomes = run_concurrently(group, "answer", lambda: 42, 8)
+    info = group.info()
+    passed = outcomes == [("result", 42)] * 8 and info.executions == 1 and info.coalesced == 7
+    print(f"8 identical calls: {info.executions} execution, {info.coalesced} coalesced "
+          f"{'✓ PASS' if passed else '✗ FAIL'}")
+
+    # Every waiter sees the leader's exception, never a None result
+    for error_type in (ValueError, SystemExit):
+        def fail():
+            raise error_type("leader failed")
+
+        outcomes = run_concurrently(SingleFlight(), "failing", fail, 5)
+        passed = all(kind == "error" and type(error) is error_type for kind, error in outcomes)
+        print(f"{error_type.__name__} in the leader reaches all 5 callers "
+              f"{'✓ PASS' if passed else '✗ FAIL'}")
+
+    # The flight is forgotten once it lands, so the next call runs again
+    print(f"Nothing in flight afterwards: {group.info().in_flight} "
+          f"{'✓ PASS' if group.info().in_flight == 0 else '✗ FAIL'}")
+
+    # Positional and keyword spellings share one key
+    coalesced_maximumExpensed.reset_flight_info()
+    same = (coalesced_maximumExpensed(500000, 0.04, 25)
+            == coalesced_maximumExpensed(balance=500000, rate=0.04, target_years=25)
+            == maximumExpensed(500000, 0.04, 25))
+    print(f"coalesced_maximumExpensed matches maximumExpensed "
+          f"{'✓ PASS' if same else '✗ FAIL'}")
+
+    print("=" * 70)